@@ -4,10 +4,18 @@ Vector store for embeddings and semantic search of presentation content.
 
 import os
 import json
+import hashlib
+from collections import OrderedDict
 from typing import List, Dict, Optional, Tuple
 from pathlib import Path
 import numpy as np
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 class VectorStore:
     """Local vector database for presentation content embeddings."""
@@ -22,36 +30,74 @@ class VectorStore:
         self.embeddings: Dict[str, List[float]] = {}
         self.metadata: Dict[str, Dict] = {}
         
+        # presentation_id -> {slide_number: doc_id}, rebuilt from metadata on load
+        self._by_presentation: Dict[str, Dict[int, str]] = {}
+        
+        # Text-hash -> embedding LRU cache, seeded from stored documents on load
+        self._embedding_cache: "OrderedDict[bytes, List[float]]" = OrderedDict()
+        self._embedding_cache_size = 4096
+        
         self._load_data()
     
     def _load_data(self):
         """Load embeddings and metadata from disk."""
         try:
             if self.embeddings_file.exists():
-                with open(self.embeddings_file, 'r') as f:
-                    self.embeddings = json.load(f)
+                self.embeddings = self._read_json(self.embeddings_file)
             
             if self.metadata_file.exists():
-                with open(self.metadata_file, 'r') as f:
-                    self.metadata = json.load(f)
+                self.metadata = self._read_json(self.metadata_file)
+            
+            for doc_id, doc_metadata in self.metadata.items():
+                self._index_document(doc_id, doc_metadata)
+            
+            for doc_id, embedding in self.embeddings.items():
+                text = self.metadata.get(doc_id, {}).get('text')
+                if text:
+                    self._cache_embedding(self._text_key(text), embedding)
             
             print(f"Loaded vector store with {len(self.embeddings)} embeddings")
         except Exception as e:
             print(f"Failed to load vector store: {e}")
             self.embeddings = {}
             self.metadata = {}
+            self._by_presentation = {}
+    
+    def _index_document(self, doc_id: str, metadata: Dict):
+        """Record a slide document under its presentation for direct lookup."""
+        presentation_id = metadata.get('presentation_id')
+        slide_number = metadata.get('slide_number')
+        if presentation_id is not None and slide_number is not None:
+            self._by_presentation.setdefault(presentation_id, {})[slide_number] = doc_id
     
     def _save_data(self):
         """Save embeddings and metadata to disk."""
         try:
-            with open(self.embeddings_file, 'w') as f:
-                json.dump(self.embeddings, f, indent=2)
-            
-            with open(self.metadata_file, 'w') as f:
-                json.dump(self.metadata, f, indent=2)
+            self._write_json(self.embeddings_file, self.embeddings)
+            self._write_json(self.metadata_file, self.metadata)
         except Exception as e:
             print(f"Failed to save vector store: {e}")
     
+    @staticmethod
+    def _read_json(path: Path):
+        """Read a JSON file, using orjson when available."""
+        with open(path, 'rb') as f:
+            data = f.read()
+        return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+    
+    @staticmethod
+    def _write_json(path: Path, obj):
+        """Write compact JSON atomically (temp file + rename)."""
+        if ORJSON_AVAILABLE:
+            data = orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+        else:
+            data = json.dumps(obj, separators=(',', ':')).encode()
+        
+        tmp_path = path.with_name(path.name + '.tmp')
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    
     def add_document(self, doc_id: str, text: str, metadata: Optional[Dict] = None):
         """Add a document to the vector store."""
         try:
@@ -64,19 +110,42 @@ class VectorStore:
                 'timestamp': time.time(),
                 **(metadata or {})
             }
+            self._index_document(doc_id, self.metadata[doc_id])
             
             self._save_data()
             print(f"📝 Added document {doc_id} to vector store")
         except Exception as e:
             print(f"Failed to add document: {e}")
     
+    @staticmethod
+    def _text_key(text: str) -> bytes:
+        """Content hash used as the embedding cache key."""
+        return hashlib.blake2b(text.encode(), digest_size=16).digest()
+    
+    def _cache_embedding(self, key: bytes, embedding: List[float]):
+        """Store an embedding in the cache, evicting the least recently used entry when full."""
+        if key not in self._embedding_cache and len(self._embedding_cache) >= self._embedding_cache_size:
+            self._embedding_cache.popitem(last=False)
+        self._embedding_cache[key] = embedding
+        self._embedding_cache.move_to_end(key)
+    
     def _generate_embedding(self, text: str) -> List[float]:
-        """Generate embedding for text (placeholder implementation)."""
+        """Generate embedding for text, reusing cached results for identical text."""
+        key = self._text_key(text)
+        embedding = self._embedding_cache.get(key)
+        if embedding is None:
+            embedding = self._compute_embedding(text)
+            self._cache_embedding(key, embedding)
+        else:
+            self._embedding_cache.move_to_end(key)
+        return embedding
+    
+    def _compute_embedding(self, text: str) -> List[float]:
+        """Compute embedding for text (placeholder implementation)."""
         # TODO: Implement actual embedding generation
         # This could use sentence-transformers, OpenAI embeddings, or other models
         
         # Placeholder: simple hash-based "embedding"
-        import hashlib
         hash_obj = hashlib.md5(text.encode())
         hash_bytes = hash_obj.digest()
         
@@ -149,10 +218,10 @@ class VectorStore:
     def get_slide_context(self, presentation_id: str, current_slide: int, context_window: int = 2) -> str:
         """Get contextual information around the current slide."""
         context_slides = []
+        slides = self._by_presentation.get(presentation_id, {})
         
-        for i in range(max(1, current_slide - context_window), 
-                      min(current_slide + context_window + 1, 100)):  # Assume max 100 slides
-            slide_id = f"{presentation_id}_slide_{i}"
+        for i in range(max(1, current_slide - context_window), current_slide + context_window + 1):
+            slide_id = slides.get(i)
             if slide_id in self.metadata:
                 slide_text = self.metadata[slide_id].get('text', '')
                 if slide_text.strip():
@@ -162,10 +231,7 @@ class VectorStore:
     
     def clear_presentation(self, presentation_id: str):
         """Remove all slides for a specific presentation."""
-        slides_to_remove = []
-        for doc_id in self.embeddings.keys():
-            if doc_id.startswith(f"{presentation_id}_slide_"):
-                slides_to_remove.append(doc_id)
+        slides_to_remove = list(self._by_presentation.pop(presentation_id, {}).values())
         
         for doc_id in slides_to_remove:
             self.embeddings.pop(doc_id, None)
@@ -2,6 +2,7 @@
 Whisper speech-to-text client for real-time transcription.
 """
 
+import re
 import threading
 import queue
 import time
@@ -10,8 +11,16 @@ import wave
 from typing import Optional, Callable, Dict, Any
 import numpy as np
 
+# Optional dependencies, populated by WhisperClient._load_dependencies
+WhisperModel = None
+pyaudio = None
+
 class WhisperClient:
-    """Client for OpenAI Whisper speech-to-text functionality."""
+    """Client for Whisper speech-to-text functionality (faster-whisper backend)."""
+
+    # Filler words that indicate uncertainty, matched in a single regex pass
+    FILLER_WORDS = frozenset({"um", "uh", "er", "ah", "like", "you know"})
+    _FILLER_RE = re.compile(r"\b(?:" + "|".join(map(re.escape, sorted(FILLER_WORDS))) + r")\b")
 
     def __init__(self, model_size: str = "base", confidence_threshold: float = 0.75):
         self.model_size = model_size
@@ -26,6 +35,17 @@ class WhisperClient:
         self.chunk_size = 1024
         self.audio_format = None  # Will be set when pyaudio is initialized
 
+        # Voice activity detection (optional, requires webrtcvad)
+        self.vad_frame_ms = 30
+        self.vad_silence_duration = 0.5  # seconds of trailing silence after speech
+        self._vad = None
+
+        # Streaming transcription over a rolling context window
+        self.context_window = 6.0  # seconds of audio decoded on each hop
+        self.hop_duration = 1.0  # seconds of new audio between decodes
+        self.prompt_chars = 200  # emitted text passed back as initial_prompt
+        self._reset_context()
+
         # Initialize Whisper model and audio
         self.model = None
         self.audio_interface = None
@@ -36,29 +56,47 @@ class WhisperClient:
     def _load_dependencies(self):
         """Load required dependencies."""
         try:
-            global whisper, pyaudio
-            import whisper
+            global WhisperModel, pyaudio
+            from faster_whisper import WhisperModel
             import pyaudio
-            self.audio_format = pyaudio.paFloat32
+            self.audio_format = pyaudio.paInt16
             print("✅ Audio dependencies loaded successfully")
         except ImportError as e:
             print(f"❌ Failed to load audio dependencies: {e}")
-            print("Install with: pip install openai-whisper pyaudio")
+            print("Install with: pip install faster-whisper pyaudio")
+
+        try:
+            import webrtcvad
+            self._vad = webrtcvad.Vad(2)
+            print("✅ Voice activity detection enabled")
+        except ImportError:
+            print("⚠️ webrtcvad not installed, falling back to amplitude silence check")
 
     def _load_model(self):
         """Load the Whisper model."""
         try:
-            if whisper is None:
+            if WhisperModel is None:
                 print("❌ Whisper not available")
                 return
 
-            print(f"🔄 Loading Whisper model '{self.model_size}'...")
-            self.model = whisper.load_model(self.model_size)
-            print(f"✅ Whisper model '{self.model_size}' loaded successfully")
+            device, compute_type = self._select_device()
+            print(f"🔄 Loading Whisper model '{self.model_size}' on {device}...")
+            self.model = WhisperModel(self.model_size, device=device, compute_type=compute_type)
+            print(f"✅ Whisper model '{self.model_size}' loaded successfully ({device}, {compute_type})")
         except Exception as e:
             print(f"❌ Failed to load Whisper model: {e}")
             self.model = None
 
+    def _select_device(self):
+        """Pick the inference device: float16 on CUDA when available, else int8 on CPU."""
+        try:
+            import ctranslate2
+            if ctranslate2.get_cuda_device_count() > 0:
+                return "cuda", "float16"
+        except Exception:
+            pass
+        return "cpu", "int8"
+
     def _init_audio_interface(self):
         """Initialize PyAudio interface."""
         try:
@@ -94,6 +132,7 @@ class WhisperClient:
 
             self.transcription_callback = callback
             self.is_listening = True
+            self._reset_context()
 
             # Start transcription thread
             self.transcription_thread = threading.Thread(target=self._transcription_loop)
@@ -129,39 +168,59 @@ class WhisperClient:
     def _audio_callback(self, in_data, frame_count, time_info, status):
         """PyAudio callback for incoming audio data."""
         if self.is_listening:
-            # Convert audio data to numpy array
-            audio_data = np.frombuffer(in_data, dtype=np.float32)
-            self.audio_queue.put(audio_data)
+            # Enqueue raw int16 bytes; conversion happens in the transcription thread
+            self.audio_queue.put(in_data)
 
         return (in_data, pyaudio.paContinue)
 
     def _transcription_loop(self):
         """Main transcription processing loop."""
         audio_buffer = []
-        buffer_duration = 3.0  # seconds
         last_transcription_time = time.time()
         silence_threshold = 1.0  # seconds of silence before processing
+        chunk_duration = self.chunk_size / self.sample_rate
+        speech_detected = False
+        trailing_silence = 0.0
 
         while self.is_listening:
             try:
                 # Collect audio data with timeout
                 try:
                     audio_chunk = self.audio_queue.get(timeout=0.1)
-                    audio_buffer.append(audio_chunk)
                     last_transcription_time = time.time()
                 except queue.Empty:
                     # Check if we should process accumulated audio due to silence
                     if (audio_buffer and
                         time.time() - last_transcription_time > silence_threshold):
-                        self._process_audio_buffer(audio_buffer)
+                        if self._vad is None or speech_detected:
+                            self._process_audio_buffer(audio_buffer, final=True)
                         audio_buffer = []
+                        speech_detected = False
+                        trailing_silence = 0.0
                     continue
 
-                # Process buffer when it reaches target duration
-                buffer_length = len(audio_buffer) * (self.chunk_size / self.sample_rate)
-                if buffer_length >= buffer_duration:
-                    self._process_audio_buffer(audio_buffer)
+                if self._vad is not None:
+                    if self._contains_speech(audio_chunk):
+                        speech_detected = True
+                        trailing_silence = 0.0
+                    elif speech_detected:
+                        trailing_silence += chunk_duration
+                    else:
+                        # No speech yet; keep only the latest chunk as pre-roll
+                        audio_buffer = [audio_chunk]
+                        continue
+
+                audio_buffer.append(audio_chunk)
+
+                # Decode every hop, and finalize once speech has ended
+                buffer_length = len(audio_buffer) * chunk_duration
+                speech_ended = trailing_silence >= self.vad_silence_duration
+                if buffer_length >= self.hop_duration or speech_ended:
+                    self._process_audio_buffer(audio_buffer, final=speech_ended)
                     audio_buffer = []
+                    if speech_ended:
+                        speech_detected = False
+                        trailing_silence = 0.0
 
             except Exception as e:
                 if self.error_callback:
@@ -169,29 +228,100 @@ class WhisperClient:
                 else:
                     print(f"❌ Transcription error: {e}")
 
-    def _process_audio_buffer(self, audio_buffer):
-        """Process accumulated audio buffer."""
+    def _contains_speech(self, audio_chunk: bytes) -> bool:
+        """Check whether any VAD frame in a raw int16 chunk contains speech."""
+        frame_bytes = self.sample_rate * self.vad_frame_ms // 1000 * 2
+        for start in range(0, len(audio_chunk) - frame_bytes + 1, frame_bytes):
+            if self._vad.is_speech(audio_chunk[start:start + frame_bytes], self.sample_rate):
+                return True
+        return False
+
+    def _process_audio_buffer(self, audio_buffer, final: bool = False):
+        """Add a hop of audio to the rolling context and emit newly stable text."""
         if not audio_buffer:
             return
 
         try:
-            # Concatenate audio chunks
-            full_audio = np.concatenate(audio_buffer)
-
-            # Skip if audio is too quiet (likely silence)
-            if np.max(np.abs(full_audio)) < 0.01:
-                return
-
-            # Transcribe audio
-            transcription = self._transcribe_audio(full_audio)
-
-            if transcription and transcription.strip() and self.transcription_callback:
-                self.transcription_callback(transcription.strip())
+            # Join raw int16 chunks and convert to float32 in one pass
+            raw = b''.join(audio_buffer)
+            hop_audio = np.frombuffer(raw, dtype=np.int16).astype(np.float32) / 32768.0
+
+            # Without VAD, treat a quiet hop as the end of an utterance
+            if self._vad is None and np.max(np.abs(hop_audio)) < 0.01:
+                text = self._commit_words(self._pending_words)
+                self._pending_words = []
+                self._context_audio = np.zeros(0, dtype=np.float32)
+            else:
+                window = int(self.context_window * self.sample_rate)
+                self._context_audio = np.concatenate((self._context_audio, hop_audio))[-window:]
+
+                # Re-decode the whole window, conditioned on what was already emitted
+                transcription = self._transcribe_audio(
+                    self._context_audio,
+                    initial_prompt=self._context_text[-self.prompt_chars:]
+                )
+                text = self._stable_text(transcription or "", final)
+                if final:
+                    self._context_audio = np.zeros(0, dtype=np.float32)
+
+            if text and self.transcription_callback:
+                self.transcription_callback(text)
 
         except Exception as e:
             print(f"❌ Error processing audio buffer: {e}")
 
-    def _transcribe_audio(self, audio_data: np.ndarray) -> Optional[str]:
+    def _reset_context(self):
+        """Reset the rolling audio/text context used for streaming."""
+        self._context_audio = np.zeros(0, dtype=np.float32)
+        self._context_text = ""
+        self._pending_words = []
+
+    @staticmethod
+    def _word_key(word: str) -> str:
+        """Normalize a word for comparison between hypotheses."""
+        return word.strip('.,!?;:"\'').lower()
+
+    def _stable_text(self, hypothesis: str, final: bool) -> str:
+        """Return the part of a window hypothesis that is new and stable.
+
+        Words already emitted are located in the hypothesis by their longest
+        overlapping tail; of the remaining words, only the prefix that agrees
+        with the previous hop's hypothesis is emitted, unless ``final``.
+        """
+        words = hypothesis.split()
+        hyp_keys = [self._word_key(w) for w in words]
+        emitted_keys = [self._word_key(w) for w in self._context_text.split()[-len(words):]] if words else []
+
+        start = 0
+        min_overlap = max(min(2, len(emitted_keys)), 1)
+        for k in range(len(emitted_keys), min_overlap - 1, -1):
+            tail = emitted_keys[-k:]
+            match = next((i for i in range(len(hyp_keys) - k + 1) if hyp_keys[i:i + k] == tail), None)
+            if match is not None:
+                start = match + k
+                break
+        candidate = words[start:]
+
+        if final:
+            self._pending_words = []
+            return self._commit_words(candidate)
+
+        stable = []
+        for word, previous in zip(candidate, self._pending_words):
+            if self._word_key(word) != self._word_key(previous):
+                break
+            stable.append(word)
+        self._pending_words = candidate[len(stable):]
+        return self._commit_words(stable)
+
+    def _commit_words(self, words) -> str:
+        """Append emitted words to the text context and return them as a string."""
+        text = ' '.join(words)
+        if text:
+            self._context_text = f"{self._context_text} {text}".strip()[-4 * self.prompt_chars:]
+        return text
+
+    def _transcribe_audio(self, audio_data: np.ndarray, initial_prompt: Optional[str] = None) -> Optional[str]:
         """Transcribe audio data to text using Whisper."""
         try:
             # Ensure audio is in the correct format for Whisper
@@ -202,15 +332,17 @@ class WhisperClient:
             if np.max(np.abs(audio_data)) > 0:
                 audio_data = audio_data / np.max(np.abs(audio_data))
 
-            # Transcribe with Whisper
-            result = self.model.transcribe(
+            # Transcribe with Whisper (segments are decoded lazily)
+            segments, _ = self.model.transcribe(
                 audio_data,
                 language=None,  # Auto-detect language
                 task="transcribe",
-                verbose=False
+                vad_filter=True,
+                initial_prompt=initial_prompt or None,
+                condition_on_previous_text=True
             )
 
-            text = result["text"].strip()
+            text = ''.join(segment.text for segment in segments).strip()
 
             # Filter out very short or repetitive transcriptions
             if len(text) < 3 or text in ["", " ", "you", "Thank you."]:
@@ -243,9 +375,8 @@ class WhisperClient:
         length_factor = min(len(transcription) / 50, 1.0)
 
         # Check for common filler words that indicate uncertainty
-        filler_words = ["um", "uh", "er", "ah", "like", "you know"]
         word_count = len(transcription.split())
-        filler_count = sum(1 for word in transcription.lower().split() if word in filler_words)
+        filler_count = len(self._FILLER_RE.findall(transcription.lower()))
         filler_penalty = filler_count / word_count if word_count > 0 else 0
 
         # Calculate confidence (0.5-0.95 range)
@@ -258,11 +389,15 @@ class WhisperClient:
             if not self.model:
                 return {"error": "Whisper model not loaded"}
 
-            result = self.model.transcribe(file_path)
+            segments, info = self.model.transcribe(file_path)
+            segments = [
+                {"start": segment.start, "end": segment.end, "text": segment.text}
+                for segment in segments
+            ]
             return {
-                "text": result["text"],
-                "segments": result["segments"],
-                "language": result["language"]
+                "text": ''.join(segment["text"] for segment in segments),
+                "segments": segments,
+                "language": info.language
             }
         except Exception as e:
             return {"error": str(e)}
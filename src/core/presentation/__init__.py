@@ -3,25 +3,27 @@
 # Import detector first (minimal dependencies)
 from .detector import PowerPointWindowDetector
 
-# Import tracker and processor with dependency handling
-try:
-    from .tracker import PresentationTracker
-    TRACKER_AVAILABLE = True
-except ImportError as e:
-    print(f"PresentationTracker not available: {e}")
-    PresentationTracker = None
-    TRACKER_AVAILABLE = False
+# Tracker and processor pull in heavy dependencies (pptx, cv2, pytesseract),
+# so they are imported on first access (PEP 562).
+_LAZY_IMPORTS = {
+    'PresentationTracker': '.tracker',
+    'ContentProcessor': '.processor',
+}
 
-try:
-    from .processor import ContentProcessor
-    PROCESSOR_AVAILABLE = True
-except ImportError as e:
-    print(f"ContentProcessor not available: {e}")
-    ContentProcessor = None
-    PROCESSOR_AVAILABLE = False
+__all__ = ['PowerPointWindowDetector', 'PresentationTracker', 'ContentProcessor']
 
-__all__ = ['PowerPointWindowDetector']
-if TRACKER_AVAILABLE:
-    __all__.append('PresentationTracker')
-if PROCESSOR_AVAILABLE:
-    __all__.append('ContentProcessor')
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    try:
+        from importlib import import_module
+        value = getattr(import_module(module_name, __name__), name)
+    except ImportError as e:
+        print(f"{name} not available: {e}")
+        value = None
+
+    globals()[name] = value
+    return value
@@ -0,0 +1,48 @@
+"""
+Shared osascript helpers for the macOS detectors.
+Scripts run through osascript are precompiled once into a .scpt cache.
+"""
+
+import hashlib
+import logging
+import subprocess
+import threading
+from pathlib import Path
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Compiled .scpt files for the osascript fallback
+SCRIPT_CACHE_DIR = Path.home() / ".cache" / "quepilot"
+
+# Spawn helpers detached: no inherited stdin/fds, own session
+SPAWN_KWARGS = {'stdin': subprocess.DEVNULL, 'close_fds': True, 'start_new_session': True}
+
+_compiled_paths: Dict[str, Optional[str]] = {}
+_compiled_paths_lock = threading.Lock()
+
+
+def compiled_script_path(source: str) -> Optional[str]:
+    """Compile source with osacompile into the script cache, once per source.
+
+    Returns the .scpt path, or None when compilation fails and the caller
+    should run the source itself.
+    """
+    with _compiled_paths_lock:
+        if source in _compiled_paths:
+            return _compiled_paths[source]
+
+        digest = hashlib.blake2b(source.encode(), digest_size=8).hexdigest()
+        path = SCRIPT_CACHE_DIR / f"{digest}.scpt"
+        try:
+            if not path.exists():
+                SCRIPT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                subprocess.run(['osacompile', '-o', str(path), '-e', source],
+                               capture_output=True, timeout=10, check=True, **SPAWN_KWARGS)
+            script_path = str(path)
+        except (OSError, subprocess.SubprocessError) as e:
+            logger.warning("AppleScript precompile failed, using source: %s", e)
+            script_path = None
+
+        _compiled_paths[source] = script_path
+        return script_path
@@ -1,8 +1,17 @@
+import ctypes
+import logging
+import os
 import platform
+import subprocess
+import threading
 import time
 import re
 from typing import Optional, List, Dict, Tuple
 
+from .applescript import SPAWN_KWARGS, compiled_script_path
+
+logger = logging.getLogger(__name__)
+
 # Import psutil with fallback
 try:
     import psutil
@@ -12,6 +21,14 @@ except ImportError:
     psutil = None
     PSUTIL_AVAILABLE = False
 
+# In-process AppleScript execution on macOS (falls back to spawning osascript)
+try:
+    from Foundation import NSAppleScript
+    NSAPPLESCRIPT_AVAILABLE = True
+except ImportError:
+    NSAppleScript = None
+    NSAPPLESCRIPT_AVAILABLE = False
+
 # Import the new screen detector
 try:
     from .screen_detector import PowerPointScreenDetector
@@ -31,28 +48,292 @@ except ImportError as e:
     PPT_DETECTOR_AVAILABLE = False
     PPTDetector = None
 
+# Resolved once; the platform cannot change during the process lifetime
+_SYSTEM = platform.system()
+
+# Also match windows of other owners/processes by title/app indicators (slower)
+_STRICT_WINDOW_MATCH = os.environ.get("QUEPILOT_STRICT") == "1"
+
+# Slide-number patterns in window titles, tried in order: the first pattern
+# that matches anywhere in the title wins, not the leftmost match
+_SLIDE_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'Slide (\d+) of (\d+)',
+    r'(\d+)/(\d+)',
+    r'(\d+) of (\d+)',
+    r'Slide (\d+)',
+))
+# Every slide format needs a digit; titles without one skip the patterns
+_HAS_DIGIT = re.compile(r'\d').search
+
+# PowerPoint process names, lowercased once ("Microsoft PowerPoint" is implied by "powerpoint")
+_POWERPOINT_PROCESS_NAMES = ("powerpoint", "powerpnt.exe")
+_POWERPOINT_PROCESS_RE = re.compile('|'.join(map(re.escape, _POWERPOINT_PROCESS_NAMES)), re.IGNORECASE)
+
+# AppleScript result: name|current|total|mode[|slide text]; slide text may contain '|'
+_OSA_RESULT_RE = re.compile(r'([^|]*)\|([^|]*)\|([^|]*)\|([^|]*)(?:\|(.*))?', re.S)
+
+# Slide info AppleScript with special handling for .ppt files. Returns
+# name|current|total|mode| (no slide text, so no per-shape traversal);
+# compiled once by _run_applescript.
+_SLIDE_INFO_APPLESCRIPT = '''
+tell application "Microsoft PowerPoint"
+    try
+        if (count of presentations) > 0 then
+            set currentPresentation to active presentation
+            set presentationName to name of currentPresentation
+            set totalSlides to count of slides of currentPresentation
+            set currentSlideNum to 1
+            set currentMode to "normal"
+            set slideDetected to false
+            set isPptFile to false
+
+            -- Check if this is a .ppt file (compatibility mode)
+            try
+                if presentationName contains ".ppt" and not (presentationName contains ".pptx") then
+                    set isPptFile to true
+                    set currentMode to "compatibility"
+                end if
+            end try
+
+            -- Method 1: Try slideshow mode first
+            try
+                if (count of slide show windows) > 0 then
+                    set currentSlideNum to slide number of slide of slide show view of slide show window 1
+                    set currentMode to "slideshow"
+                    set slideDetected to true
+                end if
+            end try
+
+            -- Method 2: Enhanced document window approach for .ppt files
+            if not slideDetected then
+                try
+                    if (count of document windows) > 0 then
+                        set docWin to document window 1
+
+                        -- For .ppt files, try different approaches
+                        if isPptFile then
+                            -- .ppt files may have different view object behavior
+                            try
+                                set viewType to view type of view of docWin
+                                -- Try to get slide from current view
+                                if viewType is not missing value then
+                                    set viewObj to view of docWin
+                                    try
+                                        -- Try getting slide index differently for .ppt
+                                        set currentSlideRef to slide of viewObj
+                                        if currentSlideRef is not missing value then
+                                            set currentSlideNum to slide number of currentSlideRef
+                                            set slideDetected to true
+                                        end if
+                                    on error
+                                        -- Fallback: try slide index property
+                                        try
+                                            set slideIdx to slide index of viewObj
+                                            if slideIdx is not missing value and slideIdx > 0 then
+                                                set currentSlideNum to slideIdx
+                                                set slideDetected to true
+                                            end if
+                                        end try
+                                    end try
+                                end if
+                            end try
+                        else
+                            -- Standard approach for .pptx files
+                            set viewObj to view of docWin
+                            try
+                                set slideIdx to slide index of viewObj
+                                if slideIdx > 0 and slideIdx <= totalSlides then
+                                    set currentSlideNum to slideIdx
+                                    set slideDetected to true
+                                end if
+                            on error
+                                try
+                                    set slideRef to slide of viewObj
+                                    if slideRef is not missing value then
+                                        set currentSlideNum to slide number of slideRef
+                                        set slideDetected to true
+                                    end if
+                                end try
+                            end try
+                        end if
+                    end if
+                end try
+            end if
+
+            -- Method 3: Selection-based detection (works better for .ppt sometimes)
+            if not slideDetected then
+                try
+                    if (count of document windows) > 0 then
+                        set selectionObj to selection of document window 1
+                        if (count of slides of selectionObj) > 0 then
+                            set selectedSlide to slide 1 of selectionObj
+                            set currentSlideNum to slide number of selectedSlide
+                            set slideDetected to true
+                        end if
+                    end if
+                end try
+            end if
+
+            -- Method 4: Fallback for .ppt files - use first slide if nothing else works
+            if not slideDetected and isPptFile then
+                try
+                    set currentSlideNum to 1
+                    set slideDetected to true
+                    set currentMode to "ppt_fallback"
+                end try
+            end if
+
+            -- Set final mode
+            if not slideDetected then
+                set currentMode to "limited"
+            else if isPptFile then
+                set currentMode to "ppt_compatibility"
+            end if
+
+            return presentationName & "|" & currentSlideNum & "|" & totalSlides & "|" & currentMode & "|"
+        else
+            return "no_presentation||||"
+        end if
+    on error errMsg
+        return "error|" & errMsg & "|||"
+    end try
+end tell
+'''
+
+# Text of one slide, fetched separately and only when the slide changes.
+# Formatted with the slide number and a length cap: collection stops once the
+# text is long enough, saving an Apple event per remaining shape. Trailing
+# whitespace is stripped in Python.
+_SLIDE_TEXT_APPLESCRIPT = '''
+tell application "Microsoft PowerPoint"
+    set slideText to ""
+    try
+        repeat with shp in shapes of slide {slide_number} of active presentation
+            if has text frame shp then
+                set slideText to slideText & text of text frame of shp & " "
+                if (length of slideText) > {max_chars} then exit repeat
+            end if
+        end repeat
+    end try
+
+    return slideText
+end tell
+'''
+
+
+
+_PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+
+# kernel32 prototypes, declared once: without argtypes/restype ctypes passes and
+# returns C ints, truncating HANDLEs on 64-bit Python
+if _SYSTEM == "Windows":
+    from ctypes import wintypes
+
+    _kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+    _kernel32.OpenProcess.argtypes = (wintypes.DWORD, wintypes.BOOL, wintypes.DWORD)
+    _kernel32.OpenProcess.restype = wintypes.HANDLE
+    _kernel32.QueryFullProcessImageNameW.argtypes = (
+        wintypes.HANDLE, wintypes.DWORD, wintypes.LPWSTR, ctypes.POINTER(wintypes.DWORD))
+    _kernel32.QueryFullProcessImageNameW.restype = wintypes.BOOL
+    _kernel32.CloseHandle.argtypes = (wintypes.HANDLE,)
+    _kernel32.CloseHandle.restype = wintypes.BOOL
+else:
+    _kernel32 = None
+
+
+def _query_process_name(pid: int) -> Optional[str]:
+    """Executable name of a process via QueryFullProcessImageNameW (Windows only)."""
+    if _kernel32 is None:
+        return None
+    handle = _kernel32.OpenProcess(_PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+    # NULL HANDLE comes back as None with restype HANDLE
+    if not handle:
+        return None
+    try:
+        buffer = ctypes.create_unicode_buffer(1024)
+        size = wintypes.DWORD(len(buffer))
+        if not _kernel32.QueryFullProcessImageNameW(handle, 0, buffer, ctypes.byref(size)):
+            return None
+        return os.path.basename(buffer.value)
+    finally:
+        _kernel32.CloseHandle(handle)
+
+
+def _int_or_none(value: Optional[str]) -> Optional[int]:
+    return int(value) if value and value.isdigit() else None
+
 class WindowInfo:
-    def __init__(self, window_id, title: str, app_name: str, position: Tuple[int, int] = None, size: Tuple[int, int] = None):
+    __slots__ = ('window_id', 'title', 'title_lower', 'app_name', 'x', 'y', 'width', 'height', 'slide_info')
+
+    def __init__(self, window_id, title: str, app_name: str, x: int = 0, y: int = 0, width: int = 0, height: int = 0):
         self.window_id = window_id
         self.title = title
+        self.title_lower = title.lower() if title else ''
         self.app_name = app_name
-        self.position = position
-        self.size = size
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+        # AppleScript slide info the title was built from (macOS untitled windows)
+        self.slide_info: Optional[Dict] = None
+
+    @property
+    def position(self) -> Tuple[int, int]:
+        return (self.x, self.y)
+
+    @property
+    def size(self) -> Tuple[int, int]:
+        return (self.width, self.height)
+
+    @property
+    def area(self) -> int:
+        return self.width * self.height
 
     def __str__(self):
         return f"WindowInfo(id={self.window_id}, title='{self.title}', app='{self.app_name}')"
 
 class PowerPointWindowDetector:
     def __init__(self):
-        self.system = platform.system()
-        self.powerpoint_process_names = [
-            "Microsoft PowerPoint",
-            "PowerPoint",
-            "POWERPNT.EXE",
-            "powerpnt.exe"
-        ]
+        self.system = _SYSTEM
+        # Specialize window enumeration once instead of branching on every poll
+        if _SYSTEM == "Darwin":
+            self.get_powerpoint_windows = self._get_powerpoint_windows_macos
+        elif _SYSTEM == "Windows":
+            self.get_powerpoint_windows = self._get_powerpoint_windows_windows
+        self.powerpoint_process_names = _POWERPOINT_PROCESS_NAMES
         self.current_window = None
         self.last_slide_info = None
+        self._last_title = None
+        self._last_title_info = None
+        self._last_logged_slide = None
+        self._slide_text_key = None
+        self._slide_text = ""
+        self.slide_text_limit = 500  # characters of slide text collected via AppleScript
+
+        # Last AppleScript slide info; reused for slide_info_ttl seconds so
+        # a poll that needs it twice (window title + slide info) runs it once
+        self.slide_info_ttl = 0.5
+        self._slide_info_cache: Tuple[float, Optional[Dict]] = (0.0, None)
+
+        # macOS app-activation wake-up used by monitor_powerpoint_window
+        self.activation_backstop = 60.0  # seconds between checks while PowerPoint is inactive
+        self._activation_event = None
+        self._activation_observer = None
+
+        # macOS Accessibility observer on the PowerPoint process; window
+        # focus/title changes wake the monitor before its poll interval ends
+        self._window_event = threading.Event()
+        self._window_observer = None
+        self._window_observer_pid = None
+
+        # Compiled NSAppleScript objects keyed by source; NSAppleScript is not
+        # thread-safe, so executions are serialized
+        self._compiled_scripts: Dict[str, object] = {}
+        self._applescript_lock = threading.Lock()
+
+        # pid -> (process name, resolved at) for Windows window enumeration
+        self.pid_name_ttl = 30.0
+        self._pid_name_cache: Dict[int, Tuple[str, float]] = {}
 
         # Initialize screen detector if available
         self.screen_detector = None
@@ -72,35 +353,28 @@ class PowerPointWindowDetector:
                 print(f"Failed to initialize PPT detector: {e}")
                 self.ppt_detector = None
 
+    # Lowercased once; indicators subsumed by a shorter one ("Microsoft PowerPoint",
+    # ".pptx", "Slide Show") are implied and not listed separately
+    _POWERPOINT_INDICATORS = ("powerpoint", ".ppt", "slide", "presentation")
+    # The same indicators as one case-insensitive alternation: a single scan,
+    # no lowercased copies of the title or app name
+    _POWERPOINT_INDICATOR_RE = re.compile('|'.join(map(re.escape, _POWERPOINT_INDICATORS)), re.IGNORECASE)
+
+    # Exact owner names checked before any substring scan
+    _POWERPOINT_OWNER_NAMES = frozenset({"Microsoft PowerPoint", "POWERPNT.EXE", "powerpnt.exe"})
+
     def is_powerpoint_window(self, window_title: str, app_name: str) -> bool:
-        powerpoint_indicators = [
-            "PowerPoint",
-            "Microsoft PowerPoint",
-            ".ppt",
-            ".pptx",
-            "Slide",
-            "Presentation",
-            "Slide Show"
-        ]
-
-        title_lower = window_title.lower()
-        app_lower = app_name.lower()
-
-        for indicator in powerpoint_indicators:
-            if indicator.lower() in title_lower or indicator.lower() in app_lower:
-                return True
-        return False
+        # The app name is the most selective signal, so check it first
+        search = self._POWERPOINT_INDICATOR_RE.search
+        return bool(search(app_name) or search(window_title))
 
-    def extract_slide_info_from_title(self, title: str) -> Dict:
-        slide_info = {
-            'current_slide': None,
-            'total_slides': None,
-            'presentation_name': None,
-            'mode': 'unknown'
-        }
+    def extract_slide_info_from_title(self, title: str, precomputed_slide_info: Optional[Dict] = None) -> Dict:
+        # Slide info already fetched while enumerating windows this poll
+        if precomputed_slide_info and precomputed_slide_info.get('current_slide'):
+            return dict(precomputed_slide_info)
 
         # For macOS, if title is empty or doesn't contain slide info, try AppleScript
-        if self.system == "Darwin" and (not title or not any(pattern in title for pattern in ['Slide', '/', 'of'])):
+        if _SYSTEM == "Darwin" and (not title or not any(pattern in title for pattern in ['Slide', '/', 'of'])):
             try:
                 applescript_info = self.get_powerpoint_slide_info_macos()
                 if applescript_info and applescript_info.get('current_slide'):
@@ -108,22 +382,30 @@ class PowerPointWindowDetector:
             except Exception as e:
                 print(f"AppleScript slide info failed: {e}")
 
-        # Fall back to title parsing for Windows or when AppleScript fails
-        slide_patterns = [
-            r'Slide (\d+) of (\d+)',
-            r'(\d+)/(\d+)',
-            r'(\d+) of (\d+)',
-            r'Slide (\d+)',
-        ]
-
-        for pattern in slide_patterns:
-            match = re.search(pattern, title, re.IGNORECASE)
-            if match:
-                groups = match.groups()
-                slide_info['current_slide'] = int(groups[0])
-                if len(groups) > 1:
-                    slide_info['total_slides'] = int(groups[1])
-                break
+        # Fall back to title parsing for Windows or when AppleScript fails.
+        # The title is usually unchanged between polls, so the last parse is
+        # memoized (AppleScript results above reflect live state and are not).
+        if title != self._last_title:
+            self._last_title, self._last_title_info = title, self._parse_title(title)
+        return dict(self._last_title_info)
+
+    def _parse_title(self, title: str) -> Dict:
+        slide_info = {
+            'current_slide': None,
+            'total_slides': None,
+            'presentation_name': None,
+            'mode': 'unknown'
+        }
+
+        if _HAS_DIGIT(title):
+            for pattern in _SLIDE_PATTERNS:
+                match = pattern.search(title)
+                if match:
+                    groups = match.groups()
+                    slide_info['current_slide'] = int(groups[0])
+                    if len(groups) > 1:
+                        slide_info['total_slides'] = int(groups[1])
+                    break
 
         if 'Slide Show' in title:
             slide_info['mode'] = 'slideshow'
@@ -132,90 +414,93 @@ class PowerPointWindowDetector:
         else:
             slide_info['mode'] = 'normal'
 
-        if not slide_info['current_slide'] and 'Slide Show' in title:
-            slide_info['mode'] = 'slideshow'
-            # Try to extract presentation name from titles like "Slide Show - My Presentation.pptx"
-            if ' - ' in title:
-                parts = title.split(' - ')
-                if len(parts) > 1:
-                    # Find the part that is likely the presentation name
-                    for part in parts:
-                        if '.ppt' in part.lower():
-                            slide_info['presentation_name'] = part.strip()
-                            break
-                    if not slide_info['presentation_name']:
-                         slide_info['presentation_name'] = parts[1].strip()
-
+        # Presentation name from titles like "Slide Show - My Presentation.pptx"
         if ' - ' in title:
             parts = title.split(' - ')
-            for part in parts:
-                if '.ppt' in part.lower():
-                    slide_info['presentation_name'] = part.strip()
-                    break
+            # One scan of the lowercased title; parts are only searched when it hits
+            ppt_part = None
+            if '.ppt' in title.lower():
+                ppt_part = next(part for part in parts if '.ppt' in part.lower())
+            if ppt_part is not None:
+                slide_info['presentation_name'] = ppt_part.strip()
+            elif not slide_info['current_slide'] and slide_info['mode'] == 'slideshow':
+                slide_info['presentation_name'] = parts[1].strip()
 
         return slide_info
 
     def get_powerpoint_windows(self) -> List[WindowInfo]:
-        if self.system == "Darwin":
-            return self._get_powerpoint_windows_macos()
-        elif self.system == "Windows":
-            return self._get_powerpoint_windows_windows()
-        else:
-            return []
+        # Unsupported platform; __init__ rebinds this to the macOS/Windows implementation
+        return []
 
     def _get_powerpoint_windows_macos(self) -> List[WindowInfo]:
         windows = []
         try:
             from Cocoa import NSWorkspace
-            from Quartz import CGWindowListCopyWindowInfo, kCGWindowListOptionOnScreenOnly, kCGNullWindowID
+            from Quartz import (CGWindowListCopyWindowInfo, kCGWindowListOptionOnScreenOnly,
+                                kCGWindowListExcludeDesktopElements, kCGNullWindowID)
 
             workspace = NSWorkspace.sharedWorkspace()
             running_apps = workspace.runningApplications()
 
             powerpoint_apps = []
             for app in running_apps:
-                app_name = app.localizedName()
                 bundle_id = app.bundleIdentifier()
-                if (any(pp_name.lower() in app_name.lower() for pp_name in self.powerpoint_process_names) or
+                if (_POWERPOINT_PROCESS_RE.search(app.localizedName() or '') or
                     (bundle_id and 'powerpoint' in bundle_id.lower())):
                     powerpoint_apps.append(app)
 
             if not powerpoint_apps:
                 return windows
 
-            window_list = CGWindowListCopyWindowInfo(kCGWindowListOptionOnScreenOnly, kCGNullWindowID)
-            presentation_title = self._get_powerpoint_presentation_title_macos()
+            window_list = CGWindowListCopyWindowInfo(
+                kCGWindowListOptionOnScreenOnly | kCGWindowListExcludeDesktopElements, kCGNullWindowID
+            )
 
+            # One pass, reading each field once. The integer owner-pid check
+            # rejects other apps' windows before any string is read;
+            # QUEPILOT_STRICT=1 also runs the full indicator scan on them.
+            ppt_pids = {app.processIdentifier() for app in powerpoint_apps}
+            presentation_title = slide_info = None
             for window_info in window_list:
-                window_title = window_info.get('kCGWindowName', '')
-                owner_name = window_info.get('kCGWindowOwnerName', '')
-                window_id = window_info.get('kCGWindowNumber')
-                layer = window_info.get('kCGWindowLayer', 0)
-                bounds = window_info.get('kCGWindowBounds', {})
-                
-                is_ppt_window = self.is_powerpoint_window(window_title, owner_name) or \
-                                (owner_name == 'Microsoft PowerPoint' and bounds.get('Width', 0) > 400 and layer == 0)
-
-                if is_ppt_window:
-                    if not window_title and presentation_title:
-                        window_title = presentation_title
-                    
-                    position = (bounds.get('X', 0), bounds.get('Y', 0))
-                    size = (bounds.get('Width', 0), bounds.get('Height', 0))
-
-                    windows.append(WindowInfo(
-                        window_id=window_id, title=window_title, app_name=owner_name,
-                        position=position, size=size
-                    ))
+                if window_info.get('kCGWindowOwnerPID') not in ppt_pids:
+                    if not _STRICT_WINDOW_MATCH:
+                        continue
+                    owner_name = window_info.get('kCGWindowOwnerName') or ''
+                    if (owner_name not in self._POWERPOINT_OWNER_NAMES and
+                            not self.is_powerpoint_window(window_info.get('kCGWindowName') or '', owner_name)):
+                        continue
+                else:
+                    owner_name = window_info.get('kCGWindowOwnerName') or ''
+                if window_info.get('kCGWindowLayer', 0) != 0:
+                    continue
+                window_title = window_info.get('kCGWindowName') or ''
+
+                # Untitled windows get their title from AppleScript, fetched at most once
+                untitled = not window_title
+                if untitled:
+                    if presentation_title is None:
+                        slide_info = self.get_powerpoint_slide_info_macos()
+                        presentation_title = self._get_powerpoint_presentation_title_macos(slide_info)
+                    window_title = presentation_title
+
+                bounds = window_info.get('kCGWindowBounds') or {}
+                window = WindowInfo(
+                    window_info.get('kCGWindowNumber'), window_title, owner_name,
+                    bounds.get('X', 0), bounds.get('Y', 0), bounds.get('Width', 0), bounds.get('Height', 0)
+                )
+                if untitled:
+                    window.slide_info = slide_info
+                windows.append(window)
         except ImportError:
             print("macOS window detection requires pyobjc-framework-Cocoa and pyobjc-framework-Quartz")
         except Exception as e:
             print(f"Error detecting macOS windows: {e}")
         return windows
 
-    def _get_powerpoint_presentation_title_macos(self) -> str:
+    def _get_powerpoint_presentation_title_macos(self, slide_info: Optional[Dict] = None) -> str:
         try:
-            slide_info = self.get_powerpoint_slide_info_macos()
+            if slide_info is None:
+                slide_info = self.get_powerpoint_slide_info_macos()
             if slide_info:
                 name = slide_info.get('presentation_name', '')
                 current = slide_info.get('current_slide', 1)
@@ -230,212 +515,111 @@ class PowerPointWindowDetector:
             pass
         return ""
 
-    def get_powerpoint_slide_info_macos(self) -> Dict:
-        try:
-            import subprocess
-            # Enhanced AppleScript with special handling for .ppt files
-            applescript = '''
-            tell application "Microsoft PowerPoint"
-                try
-                    if (count of presentations) > 0 then
-                        set currentPresentation to active presentation
-                        set presentationName to name of currentPresentation
-                        set totalSlides to count of slides of currentPresentation
-                        set currentSlideNum to 1
-                        set currentMode to "normal"
-                        set slideDetected to false
-                        set slideText to ""
-                        set isPptFile to false
-
-                        -- Check if this is a .ppt file (compatibility mode)
-                        try
-                            if presentationName contains ".ppt" and not (presentationName contains ".pptx") then
-                                set isPptFile to true
-                                set currentMode to "compatibility"
-                            end if
-                        end try
-
-                        -- Method 1: Try slideshow mode first
-                        try
-                            if (count of slide show windows) > 0 then
-                                set currentSlideNum to slide number of slide of slide show view of slide show window 1
-                                set currentMode to "slideshow"
-                                set slideDetected to true
-                                -- Get slide text in slideshow mode
-                                try
-                                    set currentSlide to slide currentSlideNum of currentPresentation
-                                    repeat with shp in shapes of currentSlide
-                                        if has text frame shp then
-                                            set slideText to slideText & text of text frame of shp & " "
-                                        end if
-                                    end repeat
-                                end try
-                            end if
-                        end try
-
-                        -- Method 2: Enhanced document window approach for .ppt files
-                        if not slideDetected then
-                            try
-                                if (count of document windows) > 0 then
-                                    set docWin to document window 1
-
-                                    -- For .ppt files, try different approaches
-                                    if isPptFile then
-                                        -- .ppt files may have different view object behavior
-                                        try
-                                            set viewType to view type of view of docWin
-                                            -- Try to get slide from current view
-                                            if viewType is not missing value then
-                                                set viewObj to view of docWin
-                                                try
-                                                    -- Try getting slide index differently for .ppt
-                                                    set currentSlideRef to slide of viewObj
-                                                    if currentSlideRef is not missing value then
-                                                        set currentSlideNum to slide number of currentSlideRef
-                                                        set slideDetected to true
-                                                    end if
-                                                on error
-                                                    -- Fallback: try slide index property
-                                                    try
-                                                        set slideIdx to slide index of viewObj
-                                                        if slideIdx is not missing value and slideIdx > 0 then
-                                                            set currentSlideNum to slideIdx
-                                                            set slideDetected to true
-                                                        end if
-                                                    end try
-                                                end try
-                                            end if
-                                        end try
-                                    else
-                                        -- Standard approach for .pptx files
-                                        set viewObj to view of docWin
-                                        try
-                                            set slideIdx to slide index of viewObj
-                                            if slideIdx > 0 and slideIdx <= totalSlides then
-                                                set currentSlideNum to slideIdx
-                                                set slideDetected to true
-                                            end if
-                                        on error
-                                            try
-                                                set slideRef to slide of viewObj
-                                                if slideRef is not missing value then
-                                                    set currentSlideNum to slide number of slideRef
-                                                    set slideDetected to true
-                                                end if
-                                            end try
-                                        end try
-                                    end if
-
-                                    -- Get slide text if we detected a slide
-                                    if slideDetected then
-                                        try
-                                            set currentSlide to slide currentSlideNum of currentPresentation
-                                            repeat with shp in shapes of currentSlide
-                                                if has text frame shp then
-                                                    set slideText to slideText & text of text frame of shp & " "
-                                                end if
-                                            end repeat
-                                        end try
-                                    end if
-                                end if
-                            end try
-                        end if
-
-                        -- Method 3: Selection-based detection (works better for .ppt sometimes)
-                        if not slideDetected then
-                            try
-                                if (count of document windows) > 0 then
-                                    set selectionObj to selection of document window 1
-                                    if (count of slides of selectionObj) > 0 then
-                                        set selectedSlide to slide 1 of selectionObj
-                                        set currentSlideNum to slide number of selectedSlide
-                                        set slideDetected to true
-
-                                        -- Get slide text from selection
-                                        try
-                                            repeat with shp in shapes of selectedSlide
-                                                if has text frame shp then
-                                                    set slideText to slideText & text of text frame of shp & " "
-                                                end if
-                                            end repeat
-                                        end try
-                                    end if
-                                end if
-                            end try
-                        end if
-
-                        -- Method 4: Fallback for .ppt files - use first slide if nothing else works
-                        if not slideDetected and isPptFile then
-                            try
-                                set currentSlideNum to 1
-                                set slideDetected to true
-                                set currentMode to "ppt_fallback"
-                                -- Try to get text from first slide
-                                try
-                                    set currentSlide to slide 1 of currentPresentation
-                                    repeat with shp in shapes of currentSlide
-                                        if has text frame shp then
-                                            set slideText to slideText & text of text frame of shp & " "
-                                        end if
-                                    end repeat
-                                end try
-                            end try
-                        end if
+    def _run_applescript(self, source: str, timeout: int = 8, cache: bool = True) -> Optional[str]:
+        """Run AppleScript and return its string result (None on failure).
+
+        Scripts are compiled once and executed in-process with NSAppleScript,
+        avoiding an osascript fork/exec per call. Without pyobjc, the script is
+        compiled once to a cached .scpt that osascript runs without reparsing.
+        Pass cache=False for one-off sources that should not be kept compiled.
+        """
+        if not NSAPPLESCRIPT_AVAILABLE:
+            script_path = compiled_script_path(source) if cache else None
+            args = ['osascript', script_path] if script_path else ['osascript', '-e', source]
+            # Bytes mode: one explicit decode, no newline translation pass
+            result = subprocess.run(args, capture_output=True, timeout=timeout, **SPAWN_KWARGS)
+            return result.stdout.decode('utf-8', 'replace') if result.returncode == 0 else None
+
+        with self._applescript_lock:
+            script = self._compiled_scripts.get(source)
+            if script is None:
+                script = NSAppleScript.alloc().initWithSource_(
+                    f"with timeout of {timeout} seconds\n{source}\nend timeout"
+                )
+                compiled, error = script.compileAndReturnError_(None)
+                if not compiled:
+                    print(f"AppleScript compile error: {error}")
+                    return None
+                if cache:
+                    self._compiled_scripts[source] = script
+
+            descriptor, error = script.executeAndReturnError_(None)
+        if descriptor is None:
+            print(f"AppleScript error: {error}")
+            return None
+        return descriptor.stringValue() or ""
+
+    def _get_slide_text_macos(self, presentation_name: str, slide_number: int) -> str:
+        """Get slide text, re-running the shape traversal only when the slide changes."""
+        key = (presentation_name, slide_number)
+        if key != self._slide_text_key:
+            output = self._run_applescript(
+                _SLIDE_TEXT_APPLESCRIPT.format(slide_number=slide_number, max_chars=self.slide_text_limit),
+                cache=False
+            )
+            self._slide_text_key, self._slide_text = key, output or ""
+        return self._slide_text
 
-                        -- Clean up slide text
-                        if slideText is not "" then
-                            set slideText to (characters 1 through (length of slideText) of slideText) as string
-                        end if
+    def get_powerpoint_slide_info_macos(self) -> Dict:
+        now = time.monotonic()
+        cached_at, cached = self._slide_info_cache
+        if cached is not None and now - cached_at < self.slide_info_ttl:
+            return dict(cached)
 
-                        -- Set final mode
-                        if not slideDetected then
-                            set currentMode to "limited"
-                        else if isPptFile then
-                            set currentMode to "ppt_compatibility"
-                        end if
+        slide_info = self._query_slide_info_macos()
+        # Failures are not cached so the next call retries immediately
+        self._slide_info_cache = (now, None if slide_info.get('mode') == 'exception' else slide_info)
+        return dict(slide_info)
 
-                        return presentationName & "|" & currentSlideNum & "|" & totalSlides & "|" & currentMode & "|" & slideText
-                    else
-                        return "no_presentation||||"
-                    end if
-                on error errMsg
-                    return "error|" & errMsg & "|||"
-                end try
-            end tell
-            '''
-            result = subprocess.run(['osascript', '-e', applescript], capture_output=True, text=True, timeout=8)
-            if result.returncode == 0 and result.stdout.strip():
-                parts = result.stdout.strip().split("|")
-                if len(parts) >= 4:
-                    if parts[0] in ["no_presentation", "error"]:
-                        print(f"PowerPoint detection: {parts[0]} - {parts[1] if len(parts) > 1 else 'No details'}")
-                        return {'mode': parts[0]}
-
-                    slide_text = parts[4] if len(parts) > 4 else ""
-                    current_slide = int(parts[1]) if parts[1].isdigit() else None
-
-                    # Log current slide and text to console
-                    if current_slide and slide_text.strip():
-                        print(f"\n=== SLIDE {current_slide} CONTENT ===")
-                        print(f"Text: {slide_text.strip()[:200]}{'...' if len(slide_text.strip()) > 200 else ''}")
-                        print("=" * 30)
-                    elif current_slide:
-                        print(f"\n=== SLIDE {current_slide} ===")
-                        print("No text content detected")
-                        print("=" * 30)
+    def _query_slide_info_macos(self) -> Dict:
+        try:
+            output = self._run_applescript(_SLIDE_INFO_APPLESCRIPT)
+            if output and output.strip():
+                match = _OSA_RESULT_RE.fullmatch(output.strip())
+                if match:
+                    name, current, total, mode, slide_text = match.groups()
+                    if name in ("no_presentation", "error"):
+                        logger.debug("PowerPoint detection: %s - %s", name, current or 'No details')
+                        return {'mode': name}
+
+                    current_slide = _int_or_none(current)
+                    slide_text = self._get_slide_text_macos(name, current_slide) if current_slide else ""
+
+                    # Log slide content only when the slide changes
+                    if current_slide and current_slide != self._last_logged_slide:
+                        self._last_logged_slide = current_slide
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug("Slide %s content: %.200s", current_slide,
+                                         slide_text.strip() or "[no text content detected]")
 
                     return {
                         'current_slide': current_slide,
-                        'total_slides': int(parts[2]) if parts[2].isdigit() else None,
-                        'presentation_name': parts[0] or None,
-                        'mode': parts[3] or 'normal',
+                        'total_slides': _int_or_none(total),
+                        'presentation_name': name or None,
+                        'mode': mode or 'normal',
                         'slide_text': slide_text.strip()
                     }
-        except (subprocess.TimeoutExpired, Exception) as e:
+        except Exception as e:
             print(f"PowerPoint detection error: {e}")
             return {'mode': 'exception'}
         return {'mode': 'unknown'}
 
+    def _get_process_name(self, pid: int) -> str:
+        """Resolve a process name, cached per pid for pid_name_ttl seconds.
+
+        Queries the image name directly through kernel32, avoiding psutil's
+        Process bookkeeping; psutil is only used if that query fails.
+        """
+        now = time.monotonic()
+        cached = self._pid_name_cache.get(pid)
+        if cached and now - cached[1] < self.pid_name_ttl:
+            return cached[0]
+        name = _query_process_name(pid)
+        if name is None:
+            name = psutil.Process(pid).name() if PSUTIL_AVAILABLE else "unknown"
+        self._pid_name_cache[pid] = (name, now)
+        return name
+
     def _get_powerpoint_windows_windows(self) -> List[WindowInfo]:
         windows = []
         try:
@@ -445,27 +629,25 @@ class PowerPointWindowDetector:
             def enum_window_callback(hwnd, windows_list):
                 if win32gui.IsWindowVisible(hwnd):
                     title = win32gui.GetWindowText(hwnd)
+                    if not title:
+                        return True
                     _, pid = win32process.GetWindowThreadProcessId(hwnd)
                     try:
-                        if PSUTIL_AVAILABLE:
-                            app_name = psutil.Process(pid).name()
-                        else:
-                            app_name = "unknown"
-
-                        if self.is_powerpoint_window(title, app_name):
-                            rect = win32gui.GetWindowRect(hwnd)
-                            pos = (rect[0], rect[1])
-                            size = (rect[2] - rect[0], rect[3] - rect[1])
-                            windows_list.append(WindowInfo(hwnd, title, app_name, pos, size))
+                        app_name = self._get_process_name(pid)
+
+                        # Exact process-name match first; other processes' titles
+                        # are only scanned with QUEPILOT_STRICT=1
+                        if app_name in self._POWERPOINT_OWNER_NAMES or (
+                                _STRICT_WINDOW_MATCH and self.is_powerpoint_window(title, app_name)):
+                            left, top, right, bottom = win32gui.GetWindowRect(hwnd)
+                            windows_list.append(WindowInfo(hwnd, title, app_name, left, top, right - left, bottom - top))
                     except Exception as e:
                         if PSUTIL_AVAILABLE:
                             try:
                                 # Try without psutil if it fails
                                 if self.is_powerpoint_window(title, "PowerPoint"):
-                                    rect = win32gui.GetWindowRect(hwnd)
-                                    pos = (rect[0], rect[1])
-                                    size = (rect[2] - rect[0], rect[3] - rect[1])
-                                    windows_list.append(WindowInfo(hwnd, title, "PowerPoint", pos, size))
+                                    left, top, right, bottom = win32gui.GetWindowRect(hwnd)
+                                    windows_list.append(WindowInfo(hwnd, title, "PowerPoint", left, top, right - left, bottom - top))
                             except:
                                 pass
                 return True
@@ -476,33 +658,194 @@ class PowerPointWindowDetector:
             print(f"Error detecting Windows windows: {e}")
         return windows
 
+    def _get_foreground_powerpoint_window(self) -> Optional[WindowInfo]:
+        """The foreground window if it belongs to PowerPoint (Windows only)."""
+        try:
+            import win32gui
+            import win32process
+
+            hwnd = win32gui.GetForegroundWindow()
+            title = win32gui.GetWindowText(hwnd) if hwnd else ''
+            if not title:
+                return None
+            _, pid = win32process.GetWindowThreadProcessId(hwnd)
+            app_name = self._get_process_name(pid)
+            if app_name not in self._POWERPOINT_OWNER_NAMES:
+                return None
+            left, top, right, bottom = win32gui.GetWindowRect(hwnd)
+            return WindowInfo(hwnd, title, app_name, left, top, right - left, bottom - top)
+        except Exception:
+            return None
+
     def get_active_powerpoint_window(self) -> Optional[WindowInfo]:
+        # A focused slide show window would win the prioritized scan anyway; skip
+        # EnumWindows. Presenter view, dialogs or an editing window in front fall through.
+        if _SYSTEM == "Windows":
+            window = self._get_foreground_powerpoint_window()
+            if window and 'slide show' in window.title_lower:
+                return window
+
         windows = self.get_powerpoint_windows()
-        if not windows: return None
-        if len(windows) == 1: return windows[0]
+        if len(windows) <= 1: return windows[0] if windows else None
+
+        # One pass: a slide show window wins outright, otherwise the largest
+        best, best_area = None, -1
         for w in windows:
-            if 'Slide Show' in w.title: return w
-        return max(windows, key=lambda w: (w.size[0] * w.size[1]) if w.size else 0)
+            if 'slide show' in w.title_lower: return w
+            area = w.width * w.height
+            if area > best_area:
+                best, best_area = w, area
+        return best
+
+    def _install_activation_observer(self) -> bool:
+        """Observe application activations on macOS so idle periods need no polling."""
+        if self._activation_observer is not None:
+            return True
+        try:
+            from Cocoa import NSWorkspace, NSWorkspaceDidActivateApplicationNotification
+
+            self._activation_event = threading.Event()
+
+            def on_activate(notification):
+                app = notification.userInfo().get('NSWorkspaceApplicationKey')
+                bundle_id = app.bundleIdentifier() if app else None
+                if bundle_id and 'powerpoint' in bundle_id.lower():
+                    self._activation_event.set()
+
+            center = NSWorkspace.sharedWorkspace().notificationCenter()
+            self._activation_observer = center.addObserverForName_object_queue_usingBlock_(
+                NSWorkspaceDidActivateApplicationNotification, None, None, on_activate
+            )
+            return True
+        except Exception as e:
+            print(f"App activation notifications unavailable, polling instead: {e}")
+            self._activation_event = None
+            return False
+
+    def _install_window_observer(self) -> bool:
+        """Observe PowerPoint window creation, focus and title changes via AXObserver.
+
+        Requires Accessibility permission; without it monitoring falls back
+        to timed polling. Reinstalled when PowerPoint restarts under a new pid.
+        """
+        try:
+            from Cocoa import NSWorkspace
+            from ApplicationServices import (AXObserverCreate, AXObserverAddNotification,
+                                             AXObserverGetRunLoopSource, AXUIElementCreateApplication,
+                                             kAXWindowCreatedNotification, kAXFocusedWindowChangedNotification,
+                                             kAXTitleChangedNotification)
+            from CoreFoundation import CFRunLoopAddSource, CFRunLoopGetMain, kCFRunLoopDefaultMode
+
+            pid = next((app.processIdentifier()
+                        for app in NSWorkspace.sharedWorkspace().runningApplications()
+                        if 'powerpoint' in (app.bundleIdentifier() or '').lower()), None)
+            if pid is None:
+                return False
+            if pid == self._window_observer_pid:
+                return True
+
+            def on_window_change(observer, element, notification, refcon):
+                self._window_event.set()
+
+            error, observer = AXObserverCreate(pid, on_window_change, None)
+            if error:
+                return False
+            app_element = AXUIElementCreateApplication(pid)
+            errors = [AXObserverAddNotification(observer, app_element, notification, None)
+                      for notification in (kAXWindowCreatedNotification,
+                                           kAXFocusedWindowChangedNotification,
+                                           kAXTitleChangedNotification)]
+            if all(errors):
+                return False
+
+            # Delivered by the main run loop, like the activation notifications
+            CFRunLoopAddSource(CFRunLoopGetMain(), AXObserverGetRunLoopSource(observer), kCFRunLoopDefaultMode)
+            self._window_observer, self._window_observer_pid = observer, pid
+            return True
+        except Exception as e:
+            print(f"Window notifications unavailable, polling instead: {e}")
+            return False
 
-    def monitor_powerpoint_window(self, callback=None, interval: float = 1.0):
+    def _is_powerpoint_frontmost(self) -> bool:
+        try:
+            from Cocoa import NSWorkspace
+            app = NSWorkspace.sharedWorkspace().frontmostApplication()
+            bundle_id = app.bundleIdentifier() if app else None
+            return bool(bundle_id and 'powerpoint' in bundle_id.lower())
+        except Exception:
+            return True
+
+    def _wait_for_event(self, event: threading.Event, timeout: float):
+        """Block until a macOS notification sets event or the timeout expires."""
+        if threading.current_thread() is not threading.main_thread():
+            # The host application's main run loop delivers the notification
+            event.wait(timeout)
+            return
+
+        # Notifications are delivered through the main run loop, so pump it;
+        # runMode_beforeDate_ returns as soon as a source has been handled.
+        # Slices are capped so Ctrl+C, raised between slices, stays responsive.
+        from Foundation import NSDate, NSDefaultRunLoopMode, NSRunLoop
+        deadline = time.monotonic() + timeout
+        run_loop = NSRunLoop.currentRunLoop()
+        while not event.is_set():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            run_loop.runMode_beforeDate_(NSDefaultRunLoopMode,
+                                         NSDate.dateWithTimeIntervalSinceNow_(min(remaining, 0.25)))
+
+    def monitor_powerpoint_window(self, callback=None, interval: float = 1.0, max_interval: float = 8.0):
+        """Poll for slide changes, backing off exponentially from interval to
+        max_interval while nothing changes and resetting on any change.
+        On macOS, PowerPoint window notifications end a wait early."""
         print(f"Starting PowerPoint monitoring (interval: {interval}s). Press Ctrl+C to stop.")
+        event_driven = _SYSTEM == "Darwin" and self._install_activation_observer()
+        if event_driven:
+            self._install_window_observer()
+        miss_streak = 0
         try:
             while True:
+                self._window_event.clear()
+                changed = False
                 window = self.get_active_powerpoint_window()
                 if window:
-                    slide_info = self.extract_slide_info_from_title(window.title)
+                    slide_info = self.extract_slide_info_from_title(window.title, window.slide_info)
                     if not self.current_window or window.title != self.current_window.title:
                         print(f"\nDetected: {window.title} ({slide_info.get('current_slide', '?')}/{slide_info.get('total_slides', '?')})")
                         self.current_window, self.last_slide_info = window, slide_info
+                        changed = True
                         if callback: callback(window, slide_info)
                     elif self.last_slide_info and slide_info.get('current_slide') != self.last_slide_info.get('current_slide'):
                         print(f"\n📄 Slide changed: {self.last_slide_info.get('current_slide', '?')} → {slide_info.get('current_slide')}")
                         self.last_slide_info = slide_info
+                        changed = True
                         if callback: callback(window, slide_info)
                 elif self.current_window:
                     print("\nPowerPoint window lost.")
                     self.current_window, self.last_slide_info = None, None
-                time.sleep(interval)
+                    changed = True
+
+                miss_streak = 0 if changed else miss_streak + 1
+
+                # While PowerPoint is in the background, sleep until it is
+                # activated (with a long backstop) instead of polling it
+                if event_driven:
+                    self._activation_event.clear()
+                    if not self._is_powerpoint_frontmost():
+                        self._wait_for_event(self._activation_event, self.activation_backstop)
+                        # PowerPoint may have been (re)launched under a new pid
+                        self._install_window_observer()
+                        miss_streak = 0
+                        continue
+
+                # On macOS the wait pumps the run loop rather than sleeping, so
+                # notifications are still delivered between polls
+                delay = min(interval * (1 << min(miss_streak, 3)), max_interval)
+                if event_driven:
+                    self._wait_for_event(self._window_event, delay)
+                else:
+                    time.sleep(delay)
         except KeyboardInterrupt:
             print("\nMonitoring stopped.")
         except Exception as e:
@@ -510,24 +853,18 @@ class PowerPointWindowDetector:
 
     def get_current_slide_info(self) -> Optional[Dict]:
         # On macOS, try PPT detector first if available (it doesn't need window detection)
-        if self.system == "Darwin" and self.ppt_detector:
+        if _SYSTEM == "Darwin" and self.ppt_detector:
             try:
                 ppt_info = self.ppt_detector.detect_current_slide_simple()
                 if ppt_info and ppt_info.get('current_slide') and ppt_info.get('is_ppt'):
-                    print(f"\n=== PPT DETECTION ===")
-                    print(f"📄 Presentation: {ppt_info.get('presentation_name', 'Unknown')}")
-                    print(f"📊 Slide: {ppt_info.get('current_slide')}/{ppt_info.get('total_slides')}")
-                    print(f"🔧 Method: {ppt_info.get('detection_method')}")
-
-                    slide_text = ppt_info.get('slide_text', '')
-                    if slide_text:
-                        if slide_text.startswith('[') and slide_text.endswith(']'):
-                            print(f"⚠️  {slide_text}")
-                        else:
-                            print(f"📝 Content: {slide_text}")
-                    else:
-                        print(f"📝 Content: [No text extracted]")
-                    print("=" * 50)
+                    if ppt_info.get('current_slide') != self._last_logged_slide:
+                        self._last_logged_slide = ppt_info.get('current_slide')
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug("PPT detection: %s slide %s/%s via %s: %s",
+                                         ppt_info.get('presentation_name', 'Unknown'),
+                                         ppt_info.get('current_slide'), ppt_info.get('total_slides'),
+                                         ppt_info.get('detection_method'),
+                                         ppt_info.get('slide_text') or "[No text extracted]")
 
                     # Convert to standard format
                     return {
@@ -544,12 +881,12 @@ class PowerPointWindowDetector:
         window = self.get_active_powerpoint_window()
         if not window:
             # If no window but we're on macOS, still try regular AppleScript
-            if self.system == "Darwin":
+            if _SYSTEM == "Darwin":
                 return self.extract_slide_info_from_title("")
             return None
 
         # First try the existing method (AppleScript on macOS, title parsing on Windows)
-        slide_info = self.extract_slide_info_from_title(window.title)
+        slide_info = self.extract_slide_info_from_title(window.title, window.slide_info)
 
         # If we couldn't get slide info and screen detector is available, use OCR fallback
         if (not slide_info.get('current_slide') or not slide_info.get('slide_text', '').strip()) and self.screen_detector:
@@ -563,11 +900,11 @@ class PowerPointWindowDetector:
                     slide_info['detection_method'] = 'screen_ocr'
                     slide_info['ocr_confidence'] = screen_info.confidence_score
 
-                    print(f"\n=== OCR DETECTION ===")
-                    print(f"Slide {screen_info.slide_number}: {screen_info.title}")
-                    print(f"Confidence: {screen_info.confidence_score:.1f}%")
-                    print(f"Content: {screen_info.content[:100]}...")
-                    print("=" * 30)
+                    if screen_info.slide_number != self._last_logged_slide:
+                        self._last_logged_slide = screen_info.slide_number
+                        logger.debug("OCR detection: slide %s %r (confidence %.1f%%): %.100s",
+                                     screen_info.slide_number, screen_info.title,
+                                     screen_info.confidence_score, screen_info.content)
             except Exception as e:
                 print(f"Screen detection fallback failed: {e}")
 
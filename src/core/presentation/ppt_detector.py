@@ -3,8 +3,242 @@ Specialized PowerPoint .ppt file detector for macOS.
 This handles the specific quirks of older .ppt files in PowerPoint.
 """
 
+import asyncio
+import logging
+import re
 import subprocess
-from typing import Dict, Optional
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .applescript import SPAWN_KWARGS, compiled_script_path
+
+logger = logging.getLogger(__name__)
+
+# Slide numbers in document window titles, tried in order (first pattern wins)
+_SLIDE_TITLE_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'Slide (\d+)',
+    r'(\d+) of \d+',
+    r'(\d+)/\d+',
+))
+
+# Text of one slide. Scripts take arguments through handlers, so each
+# source is compiled once: osascript passes them as argv to the run
+# handler, OSAKit calls the named handler directly.
+_SLIDE_TEXT_HANDLER = '''on slidetext(slideNum)
+    with timeout of 4 seconds
+        tell application "Microsoft PowerPoint"
+            try
+                set currentPresentation to active presentation
+                set targetSlide to slide slideNum of currentPresentation
+                set textList to {}
+                set shapeCount to count of shapes of targetSlide
+
+                repeat with i from 1 to shapeCount
+                    try
+                        set currentShape to shape i of targetSlide
+                        try
+                            set shapeText to text of text frame of currentShape
+                            if shapeText is not "" then
+                                set end of textList to shapeText
+                            end if
+                        on error
+                            -- This shape doesn't have text
+                        end try
+                    on error
+                        -- Skip this shape entirely
+                    end try
+                end repeat
+
+                if (count of textList) > 0 then
+                    -- Join once instead of re-copying the text on every shape
+                    set savedDelimiters to AppleScript's text item delimiters
+                    set AppleScript's text item delimiters to " | "
+                    set slideText to textList as text
+                    set AppleScript's text item delimiters to savedDelimiters
+                    return slideText
+                else
+                    return "[No text found in " & shapeCount & " shapes on slide " & slideNum & "]"
+                end if
+            on error errMsg
+                return "[AppleScript error: " & errMsg & "]"
+            end try
+        end tell
+    end timeout
+end slidetext'''
+
+_SLIDE_TEXT_SCRIPT = '''on run argv
+    return slidetext(item 1 of argv as integer)
+end run
+
+''' + _SLIDE_TEXT_HANDLER
+
+# Texts of several slides in one round-trip, for a comma-separated list of
+# slide numbers. Returns number<US>text records separated by <RS>.
+_SLIDE_TEXTS_SCRIPT = '''on run argv
+    return slidetexts(item 1 of argv)
+end run
+
+on slidetexts(slideList)
+    set savedDelimiters to AppleScript's text item delimiters
+    set AppleScript's text item delimiters to ","
+    set slideNums to text items of slideList
+    set AppleScript's text item delimiters to savedDelimiters
+
+    set slideRecords to {}
+    repeat with slideNum in slideNums
+        set end of slideRecords to (slideNum as text) & (character id 31) & my slidetext(slideNum as integer)
+    end repeat
+
+    set AppleScript's text item delimiters to (character id 30)
+    set joined to slideRecords as text
+    set AppleScript's text item delimiters to savedDelimiters
+    return joined
+end slidetexts
+
+''' + _SLIDE_TEXT_HANDLER
+
+# Presentation info, current slide and its text in one round-trip. Slide
+# detection tries the slideshow, then the selection, then the view of the
+# document window; the window title is returned for parsing in Python.
+# cachedSlides is a comma-separated list of slides of cachedPresentation
+# whose text the caller already has. Their text is only skipped during a
+# slideshow; in Normal view the slide may have been edited, so it is re-read.
+# Returns name|total|docWindows|slideshowWindows|method|slide|title|text
+_DETECT_SCRIPT = '''on run argv
+    return detectslide(item 1 of argv, item 2 of argv)
+end run
+
+on detectslide(cachedPresentation, cachedSlides)
+    with timeout of 10 seconds
+        tell application "Microsoft PowerPoint"
+            try
+                if (count of presentations) = 0 then return "no_presentation"
+                set currentPresentation to active presentation
+                set presentationName to name of currentPresentation
+                set totalSlides to count of slides of currentPresentation
+                set windowCount to count of document windows
+                set slideshowCount to count of slide show windows
+                set detectionMethod to ""
+                set slideNum to 0
+                set winTitle to ""
+
+                if slideshowCount > 0 then
+                    try
+                        set slideNum to slide number of slide of slide show view of slide show window 1
+                        set detectionMethod to "slideshow"
+                    end try
+                end if
+
+                if detectionMethod is "" and windowCount > 0 then
+                    try
+                        set winTitle to name of document window 1
+                    end try
+                    try
+                        set selObj to selection of document window 1
+                        if (count of slides of selObj) > 0 then
+                            set slideNum to slide number of (slide 1 of selObj)
+                            set detectionMethod to "selection"
+                        end if
+                    end try
+                    if detectionMethod is "" then
+                        try
+                            set currentSlide to slide of view of document window 1
+                            if currentSlide is not missing value then
+                                set slideNum to slide number of currentSlide
+                                set detectionMethod to "view"
+                            end if
+                        end try
+                    end if
+                end if
+
+                -- The caller's cache belongs to another deck, or may be stale outside a slideshow
+                if presentationName is not cachedPresentation or detectionMethod is not "slideshow" then
+                    set cachedSlides to ""
+                end if
+
+                set slideText to ""
+                if slideNum > 0 and ("," & cachedSlides & ",") does not contain ("," & slideNum & ",") then
+                    set slideText to my slidetext(slideNum)
+                end if
+
+                return presentationName & "|" & totalSlides & "|" & windowCount & "|" & slideshowCount & "|" & detectionMethod & "|" & slideNum & "|" & winTitle & "|" & slideText
+            on error errMsg
+                return "error|" & errMsg
+            end try
+        end tell
+    end timeout
+end detectslide
+
+''' + _SLIDE_TEXT_HANDLER
+
+class _OSAKitRunner:
+    """Runs AppleScript in-process through OSAKit, compiling each source once.
+
+    Falls back to spawning osascript on a script precompiled with
+    osacompile when PyObjC/OSAKit is unavailable.
+    """
+
+    def __init__(self):
+        self._scripts: Dict[str, object] = {}
+        self._lock = threading.Lock()
+        self._osa_script_class = None
+        self._descriptor_class = None
+        self._loaded = False
+
+    def _load(self):
+        if not self._loaded:
+            self._loaded = True
+            try:
+                import objc
+                from Foundation import NSAppleEventDescriptor
+                namespace = {}
+                objc.loadBundle('OSAKit', namespace,
+                                bundle_path='/System/Library/Frameworks/OSAKit.framework')
+                self._osa_script_class = namespace['OSAScript']
+                self._descriptor_class = NSAppleEventDescriptor
+            except Exception as e:
+                logger.info("OSAKit not available, using osascript: %s", e)
+        return self._osa_script_class
+
+    def run(self, source: str, timeout: int, handler: Optional[str] = None,
+            args: Sequence = ()) -> Tuple[Optional[str], str]:
+        """Run source and return (result, error); result is None on failure.
+
+        Scripts taking args define an explicit run handler (for osascript's
+        argv) and a lowercase-named handler called directly through OSAKit;
+        they set their own timeout, since handlers cannot be wrapped.
+        """
+        osa_script_class = self._load()
+        if osa_script_class is None:
+            script_path = compiled_script_path(source)
+            command = [script_path] if script_path else ['-e', source]
+            result = subprocess.run(['osascript', *command, *map(str, args)],
+                                    capture_output=True, text=True, timeout=timeout, **SPAWN_KWARGS)
+            if result.returncode == 0:
+                return result.stdout, ''
+            return None, result.stderr.strip()
+
+        # OSAScript instances are not thread-safe; the monitor thread shares them
+        with self._lock:
+            script = self._scripts.get(source)
+            if script is None:
+                wrapped = source if handler else f"with timeout of {timeout} seconds\n{source}\nend timeout"
+                script = osa_script_class.alloc().initWithSource_(wrapped)
+                compiled, error = script.compileAndReturnError_(None)
+                if not compiled:
+                    return None, str(error)
+                self._scripts[source] = script
+
+            if handler:
+                arguments = [self._descriptor_class.descriptorWithInt32_(arg) if isinstance(arg, int)
+                             else self._descriptor_class.descriptorWithString_(str(arg)) for arg in args]
+                descriptor, error = script.executeHandlerWithName_arguments_error_(handler, arguments, None)
+            else:
+                descriptor, error = script.executeAndReturnError_(None)
+        if descriptor is None:
+            return None, str(error)
+        return descriptor.stringValue() or '', ''
 
 class PPTDetector:
     """Specialized detector for .ppt files on macOS using AppleScript"""
@@ -12,6 +246,30 @@ class PPTDetector:
     def __init__(self):
         self.last_known_slide = 1
         self.presentation_info = None
+        self._osa = _OSAKitRunner()
+        self._last_name = None
+        self._last_is_ppt = False
+        # Slide texts of the current presentation, keyed by (presentation, slide)
+        # in LRU order; cleared when the presentation changes
+        self.text_cache_size = 64
+        self._text_cache: OrderedDict = OrderedDict()
+        self._cache_presentation = None
+
+        # Slide-text requests from concurrent aget_slide_texts callers are
+        # collected for text_batch_window seconds and fetched in one call.
+        # Pending futures are kept per event loop. _text_lock guards them and
+        # the text cache, which detection also uses from worker threads.
+        self.text_batch_window = 0.05
+        self._pending_texts: Dict[asyncio.AbstractEventLoop, Dict[int, asyncio.Future]] = {}
+        self._flush_tasks = set()
+        self._text_lock = threading.RLock()
+
+    def _is_ppt(self, presentation_name: str) -> bool:
+        """Whether the presentation is a legacy .ppt file, cached for the last name"""
+        if presentation_name != self._last_name:
+            self._last_name = presentation_name
+            self._last_is_ppt = presentation_name.lower().endswith('.ppt')
+        return self._last_is_ppt
 
     def get_basic_info(self) -> Optional[Dict]:
         """Get basic presentation information"""
@@ -36,44 +294,85 @@ class PPTDetector:
         '''
 
         try:
-            result = subprocess.run(['osascript', '-e', applescript],
-                                  capture_output=True, text=True, timeout=5)
-            if result.returncode == 0 and result.stdout.strip():
-                parts = result.stdout.strip().split("|")
+            output, _ = self._osa.run(applescript, timeout=5)
+            if output and output.strip():
+                parts = output.strip().split("|")
                 if len(parts) >= 4:
                     return {
                         'presentation_name': parts[0],
                         'total_slides': int(parts[1]) if parts[1].isdigit() else 0,
                         'document_windows': int(parts[2]) if parts[2].isdigit() else 0,
                         'slideshow_windows': int(parts[3]) if parts[3].isdigit() else 0,
-                        'is_ppt': '.ppt' in parts[0] and '.pptx' not in parts[0]
+                        'is_ppt': self._is_ppt(parts[0])
                     }
         except Exception as e:
-            print(f"Failed to get basic info: {e}")
+            logger.warning("Failed to get basic info: %s", e)
         return None
 
     def detect_current_slide_simple(self) -> Optional[Dict]:
-        """Simple slide detection for .ppt files"""
-        basic_info = self.get_basic_info()
-        if not basic_info:
-            return None
+        """Simple slide detection for .ppt files, in a single AppleScript call"""
+        # The script ignores this list unless the active deck is still _cache_presentation
+        with self._text_lock:
+            cached = ','.join(str(slide) for _, slide in self._text_cache)
+            cache_presentation = self._cache_presentation
 
-        # For slideshow mode
-        if basic_info['slideshow_windows'] > 0:
-            slide_info = self._detect_slideshow_slide()
-            if slide_info:
-                slide_info.update(basic_info)
-                return slide_info
+        try:
+            output, error = self._osa.run(_DETECT_SCRIPT, timeout=10, handler='detectslide',
+                                          args=(cache_presentation or '', cached))
+        except Exception as e:
+            logger.warning("Slide detection failed: %s", e)
+            return None
+        if output is None:
+            logger.warning("Slide detection failed: %s", error)
+            return None
 
-        # For normal mode - try different approaches
-        slide_info = self._detect_normal_slide()
-        if slide_info:
-            slide_info.update(basic_info)
-            return slide_info
+        parts = output.strip().split("|", 7)
+        if len(parts) < 8:
+            return None
+        name, total, doc_windows, slideshow_windows, method, slide, title, text = parts
+        basic_info = {
+            'presentation_name': name,
+            'total_slides': int(total) if total.isdigit() else 0,
+            'document_windows': int(doc_windows) if doc_windows.isdigit() else 0,
+            'slideshow_windows': int(slideshow_windows) if slideshow_windows.isdigit() else 0,
+            'is_ppt': self._is_ppt(name)
+        }
+        slide_num = int(slide) if slide.isdigit() else 0
+        text = text.strip()
+
+        with self._text_lock:
+            if name != self._cache_presentation:
+                self._text_cache.clear()
+                self._cache_presentation = name
+
+        # Slides can only be edited outside a slideshow, so only then may the cache be stale
+        refresh = method != 'slideshow'
+
+        # In normal mode a slide number in the window title takes precedence
+        if method != 'slideshow':
+            match = next(filter(None, (pattern.search(title) for pattern in _SLIDE_TITLE_PATTERNS)), None)
+            if match:
+                title_slide = int(match.group(1))
+                if title_slide != slide_num:
+                    slide_num, text = title_slide, ''
+                method = 'window_title'
+
+        if method and slide_num:
+            self.last_known_slide = slide_num
+            if text:
+                self._cache_text(slide_num, text)
+            else:
+                text = self._get_slide_text(slide_num, refresh=refresh)
+            return {
+                'current_slide': slide_num,
+                'detection_method': method,
+                'slide_text': text,
+                **basic_info
+            }
 
         # Fallback: assume slide 1 for .ppt files
         if basic_info['is_ppt']:
-            print("Using fallback detection for .ppt file")
+            logger.debug("Using fallback detection for .ppt file")
             return {
                 'current_slide': self.last_known_slide,
                 'slide_text': '',
@@ -83,269 +382,164 @@ class PPTDetector:
 
         return None
 
-    def _detect_slideshow_slide(self) -> Optional[Dict]:
-        """Detect current slide in slideshow mode"""
-        applescript = '''
-        tell application "Microsoft PowerPoint"
-            try
-                if (count of slide show windows) > 0 then
-                    set slideNum to slide number of slide of slide show view of slide show window 1
-                    return "slideshow|" & slideNum
-                else
-                    return "slideshow|no_window"
-                end if
-            on error errMsg
-                return "slideshow|error|" & errMsg
-            end try
-        end tell
-        '''
+    def _cache_text(self, slide_num: int, text: str):
+        """Remember a slide's text, unless it is an error report"""
+        if text.startswith(('[AppleScript', '[Python exception')):
+            return
+        with self._text_lock:
+            key = (self._cache_presentation, slide_num)
+            self._text_cache[key] = text
+            self._text_cache.move_to_end(key)
+            if len(self._text_cache) > self.text_cache_size:
+                self._text_cache.popitem(last=False)
+
+    def _get_slide_text(self, slide_num: int, refresh: bool = False) -> str:
+        """Get text content from a specific slide with enhanced extraction.
+
+        refresh re-reads the slide (e.g. in Normal view, where it may have been
+        edited) instead of serving the cached text.
+        """
+        if not refresh:
+            with self._text_lock:
+                key = (self._cache_presentation, slide_num)
+                text = self._text_cache.get(key)
+                if text is not None:
+                    self._text_cache.move_to_end(key)
+                    return text
 
         try:
-            result = subprocess.run(['osascript', '-e', applescript],
-                                  capture_output=True, text=True, timeout=3)
-            if result.returncode == 0:
-                parts = result.stdout.strip().split("|")
-                if len(parts) >= 2 and parts[0] == "slideshow" and parts[1].isdigit():
-                    slide_num = int(parts[1])
-                    self.last_known_slide = slide_num
-                    return {
-                        'current_slide': slide_num,
-                        'detection_method': 'slideshow',
-                        'slide_text': self._get_slide_text(slide_num)
-                    }
-        except Exception as e:
-            print(f"Slideshow detection failed: {e}")
-        return None
-
-    def _detect_normal_slide(self) -> Optional[Dict]:
-        """Detect current slide in normal editing mode"""
-        # Method 1: Try to detect from window title if it contains slide info
-        title_info = self._get_window_title_info()
-        if title_info:
-            return title_info
-
-        # Method 2: Try selection-based detection
-        selection_info = self._detect_from_selection()
-        if selection_info:
-            return selection_info
-
-        # Method 3: Try view-based detection (simpler approach)
-        view_info = self._detect_from_view()
-        if view_info:
-            return view_info
-
-        return None
-
-    def _get_window_title_info(self) -> Optional[Dict]:
-        """Try to extract slide info from window title"""
-        applescript = '''
-        tell application "Microsoft PowerPoint"
-            try
-                if (count of document windows) > 0 then
-                    set winTitle to name of document window 1
-                    return "title|" & winTitle
-                else
-                    return "title|no_window"
-                end if
-            on error errMsg
-                return "title|error|" & errMsg
-            end try
-        end tell
-        '''
-
-        try:
-            result = subprocess.run(['osascript', '-e', applescript],
-                                  capture_output=True, text=True, timeout=3)
-            if result.returncode == 0:
-                parts = result.stdout.strip().split("|", 1)
-                if len(parts) >= 2:
-                    title = parts[1]
-                    # Look for slide patterns in title
-                    import re
-                    slide_patterns = [
-                        r'Slide (\d+)',
-                        r'(\d+) of \d+',
-                        r'(\d+)/\d+'
-                    ]
-
-                    for pattern in slide_patterns:
-                        match = re.search(pattern, title, re.IGNORECASE)
-                        if match:
-                            slide_num = int(match.group(1))
-                            self.last_known_slide = slide_num
-                            return {
-                                'current_slide': slide_num,
-                                'detection_method': 'window_title',
-                                'slide_text': self._get_slide_text(slide_num)
-                            }
-        except Exception as e:
-            print(f"Window title detection failed: {e}")
-        return None
-
-    def _detect_from_selection(self) -> Optional[Dict]:
-        """Try to detect slide from current selection"""
-        applescript = '''
-        tell application "Microsoft PowerPoint"
-            try
-                if (count of document windows) > 0 then
-                    set selObj to selection of document window 1
-                    if (count of slides of selObj) > 0 then
-                        set selSlide to slide 1 of selObj
-                        set slideNum to slide number of selSlide
-                        return "selection|" & slideNum
-                    else
-                        return "selection|no_slides"
-                    end if
-                else
-                    return "selection|no_window"
-                end if
-            on error errMsg
-                return "selection|error|" & errMsg
-            end try
-        end tell
-        '''
-
-        try:
-            result = subprocess.run(['osascript', '-e', applescript],
-                                  capture_output=True, text=True, timeout=3)
-            if result.returncode == 0:
-                parts = result.stdout.strip().split("|")
-                if len(parts) >= 2 and parts[0] == "selection" and parts[1].isdigit():
-                    slide_num = int(parts[1])
-                    self.last_known_slide = slide_num
-                    return {
-                        'current_slide': slide_num,
-                        'detection_method': 'selection',
-                        'slide_text': self._get_slide_text(slide_num)
-                    }
-        except Exception as e:
-            print(f"Selection detection failed: {e}")
-        return None
-
-    def _detect_from_view(self) -> Optional[Dict]:
-        """Simple view-based detection"""
-        applescript = '''
-        tell application "Microsoft PowerPoint"
-            try
-                if (count of document windows) > 0 then
-                    set docWin to document window 1
-
-                    -- Try to get any slide reference we can
-                    try
-                        set viewObj to view of docWin
-                        set currentSlide to slide of viewObj
-                        if currentSlide is not missing value then
-                            set slideNum to slide number of currentSlide
-                            return "view|" & slideNum
-                        else
-                            return "view|no_slide_ref"
-                        end if
-                    on error
-                        return "view|error_getting_slide"
-                    end try
-                else
-                    return "view|no_window"
-                end if
-            on error errMsg
-                return "view|error|" & errMsg
-            end try
-        end tell
-        '''
-
-        try:
-            result = subprocess.run(['osascript', '-e', applescript],
-                                  capture_output=True, text=True, timeout=3)
-            if result.returncode == 0:
-                parts = result.stdout.strip().split("|")
-                if len(parts) >= 2 and parts[0] == "view" and parts[1].isdigit():
-                    slide_num = int(parts[1])
-                    self.last_known_slide = slide_num
-                    return {
-                        'current_slide': slide_num,
-                        'detection_method': 'view',
-                        'slide_text': self._get_slide_text(slide_num)
-                    }
-        except Exception as e:
-            print(f"View detection failed: {e}")
-        return None
-
-    def _get_slide_text(self, slide_num: int) -> str:
-        """Get text content from a specific slide with enhanced extraction"""
-        # Create working AppleScript based on test results
-        applescript = f'''tell application "Microsoft PowerPoint"
-    try
-        set currentPresentation to active presentation
-        set targetSlide to slide {slide_num} of currentPresentation
-        set slideText to ""
-        set shapeCount to count of shapes of targetSlide
-
-        repeat with i from 1 to shapeCount
-            try
-                set currentShape to shape i of targetSlide
-                try
-                    set shapeText to text of text frame of currentShape
-                    if shapeText is not "" then
-                        set slideText to slideText & shapeText & " | "
-                    end if
-                on error
-                    -- This shape doesn't have text
-                end try
-            on error
-                -- Skip this shape entirely
-            end try
-        end repeat
-
-        if slideText is not "" then
-            return slideText
-        else
-            return "[No text found in " & shapeCount & " shapes on slide " & {slide_num} & "]"
-        end if
-    on error errMsg
-        return "[AppleScript error: " & errMsg & "]"
-    end try
-end tell'''
-
-        try:
-            # Use heredoc approach to avoid AppleScript parsing issues
-            result = subprocess.run(['osascript'], input=applescript,
-                                  capture_output=True, text=True, timeout=10)
-            if result.returncode == 0:
-                text = result.stdout.strip()
+            output, error = self._osa.run(_SLIDE_TEXT_SCRIPT, timeout=4,
+                                          handler='slidetext', args=(slide_num,))
+            if output is not None:
+                text = output.strip()
                 # Log the extraction attempt
-                print(f"🔍 Text extraction for slide {slide_num}: {len(text)} characters")
-                if text and not text.startswith('['):
-                    print(f"📝 Content preview: {text[:150]}{'...' if len(text) > 150 else ''}")
-                elif text.startswith('['):
-                    print(f"ℹ️  Status: {text}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Text extraction for slide %d: %d characters", slide_num, len(text))
+                    if text and not text.startswith('['):
+                        logger.debug("Content preview: %.150s", text)
+                    elif text.startswith('['):
+                        logger.debug("Status: %s", text)
+                self._cache_text(slide_num, text)
                 return text
             else:
-                error_msg = f"[AppleScript execution failed: {result.stderr.strip()}]"
-                print(f"❌ Text extraction error: {error_msg}")
+                error_msg = f"[AppleScript execution failed: {error}]"
+                logger.warning("Text extraction error: %s", error_msg)
                 return error_msg
         except Exception as e:
             error_msg = f"[Python exception: {str(e)}]"
-            print(f"❌ Text extraction exception: {error_msg}")
+            logger.warning("Text extraction exception: %s", error_msg)
             return error_msg
 
-    def monitor_slide_changes(self, callback, interval=2.0):
-        """Monitor for slide changes"""
-        import time
-        import threading
-
-        def monitor_loop():
-            last_slide = None
-            while True:
-                try:
-                    current_info = self.detect_current_slide_simple()
-                    if current_info and current_info.get('current_slide') != last_slide:
-                        last_slide = current_info.get('current_slide')
-                        if callback:
-                            callback(current_info)
-                except Exception as e:
-                    print(f"Monitoring error: {e}")
-                time.sleep(interval)
-
-        thread = threading.Thread(target=monitor_loop, daemon=True)
+    def _get_slide_texts(self, slide_nums: List[int]) -> Dict[int, str]:
+        """Get the text of several slides in one AppleScript call"""
+        output, error = self._osa.run(_SLIDE_TEXTS_SCRIPT, timeout=4 * len(slide_nums), handler='slidetexts',
+                                      args=(','.join(str(slide_num) for slide_num in slide_nums),))
+        if output is None:
+            logger.warning("Batch text extraction failed: %s", error)
+            return {}
+
+        texts = {}
+        for record in output.strip().split('\x1e'):
+            slide, _, text = record.partition('\x1f')
+            if slide.isdigit():
+                texts[int(slide)] = text.strip()
+        return texts
+
+    async def aget_slide_texts(self, slide_nums: List[int]) -> Dict[int, str]:
+        """Get the text of several slides, e.g. to preload upcoming ones.
+
+        Cached slides are answered directly; the rest are queued and fetched
+        together with other callers' requests on the same event loop in a
+        single AppleScript call.
+        """
+        loop = asyncio.get_running_loop()
+        texts = {}
+        waiting = {}
+        with self._text_lock:
+            pending = self._pending_texts.get(loop)
+            start_flush = pending is None
+            if start_flush:
+                pending = {}
+            for slide_num in dict.fromkeys(slide_nums):
+                key = (self._cache_presentation, slide_num)
+                text = self._text_cache.get(key)
+                if text is not None:
+                    self._text_cache.move_to_end(key)
+                    texts[slide_num] = text
+                    continue
+                future = pending.get(slide_num)
+                if future is None:
+                    future = pending[slide_num] = loop.create_future()
+                waiting[slide_num] = future
+            if start_flush and pending:
+                self._pending_texts[loop] = pending
+            else:
+                start_flush = False
+
+        if start_flush:
+            # The loop only keeps weak references to tasks
+            task = loop.create_task(self._flush_slide_texts(loop))
+            self._flush_tasks.add(task)
+            task.add_done_callback(self._flush_tasks.discard)
+        for slide_num, future in waiting.items():
+            texts[slide_num] = await asyncio.shield(future)
+        return texts
+
+    async def _flush_slide_texts(self, loop: asyncio.AbstractEventLoop):
+        """Fetch all slide texts queued on this loop after the batch window"""
+        try:
+            await asyncio.sleep(self.text_batch_window)
+        finally:
+            with self._text_lock:
+                pending = self._pending_texts.pop(loop, {})
+                presentation = self._cache_presentation
+
+        try:
+            texts = await asyncio.to_thread(self._get_slide_texts, list(pending))
+        except Exception as e:
+            for future in pending.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for slide_num, future in pending.items():
+            text = texts.get(slide_num, '')
+            with self._text_lock:
+                # Do not file another deck's text under the new presentation
+                if text and self._cache_presentation == presentation:
+                    self._cache_text(slide_num, text)
+            if not future.done():
+                future.set_result(text)
+
+    async def amonitor(self, callback, base_interval: float = 2.0, max_interval: float = 15.0):
+        """Monitor for slide changes on an asyncio event loop.
+
+        The poll interval doubles while the slide is unchanged (up to
+        max_interval) and resets to base_interval on a change. AppleScript
+        calls block, so each poll runs in a worker thread.
+        """
+        last_slide = None
+        delay = base_interval
+        while True:
+            try:
+                current_info = await asyncio.to_thread(self.detect_current_slide_simple)
+                if current_info and current_info.get('current_slide') != last_slide:
+                    last_slide = current_info.get('current_slide')
+                    delay = base_interval
+                    if callback:
+                        callback(current_info)
+                else:
+                    delay = min(delay * 2, max_interval)
+            except Exception as e:
+                logger.warning("Monitoring error: %s", e)
+            await asyncio.sleep(delay)
+
+    def monitor_slide_changes(self, callback, interval=2.0, max_interval=15.0):
+        """Monitor for slide changes in a background thread running amonitor"""
+        thread = threading.Thread(
+            target=lambda: asyncio.run(self.amonitor(callback, interval, max_interval)),
+            daemon=True
+        )
         thread.start()
         return thread
 
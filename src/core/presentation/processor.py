@@ -3,21 +3,31 @@ Content processing utilities for presentations.
 Handles text extraction, OCR, and content analysis.
 """
 
-import cv2
+import logging
 import numpy as np
-import pytesseract
-from PIL import Image
-from typing import List, Dict, Optional
-from pptx.slide import Slide
+from typing import List, Dict, Optional, TYPE_CHECKING
+
+# cv2, pytesseract and PIL are imported inside the methods that use them:
+# OpenCV alone adds hundreds of milliseconds and tens of MB to startup,
+# which text-only callers should not pay
+if TYPE_CHECKING:
+    from PIL import Image
+    from pptx.slide import Slide
+
+logger = logging.getLogger(__name__)
 
 
 class ContentProcessor:
     """Handles content extraction and processing from presentation slides."""
     
+    # Font for slide_to_image, loaded on first use and shared by all instances
+    _FONT = None
+    
     def __init__(self):
         self.ocr_config = r'--oem 3 --psm 6 -c tessedit_char_whitelist=ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789.,!?;:()[]{}"\'-+=/\\@#$%^&*<>|~`_ '
+        self._gray_buf: Optional[np.ndarray] = None
     
-    def extract_slide_text(self, slide: Slide) -> str:
+    def extract_slide_text(self, slide: 'Slide') -> str:
         """Extract text content from a slide."""
         text_content = []
         
@@ -38,42 +48,57 @@ class ContentProcessor:
             
             return '\n'.join(text_content)
         except Exception as e:
-            print(f"Error extracting slide text: {str(e)}")
+            logger.warning("Error extracting slide text: %s", e)
             return ""
     
     def _extract_shape_text(self, shape) -> str:
-        """Extract text from a shape."""
+        """Extract text from a shape; a shape that fails is skipped, not the slide."""
         try:
-            # Direct text access
-            if hasattr(shape, 'text') and shape.text:
-                return shape.text.strip()
-            
-            # Text frame access
-            if hasattr(shape, 'text_frame') and shape.text_frame:
-                text_parts = []
-                for paragraph in shape.text_frame.paragraphs:
-                    paragraph_text = ""
-                    for run in paragraph.runs:
-                        if run.text:
-                            paragraph_text += run.text
-                    if paragraph_text.strip():
-                        text_parts.append(paragraph_text.strip())
-                return '\n'.join(text_parts)
-            
-            # Table content
-            if hasattr(shape, 'table') and shape.table:
-                table_text = []
-                for row in shape.table.rows:
-                    row_text = []
-                    for cell in row.cells:
-                        cell_text = self._extract_shape_text(cell)
-                        if cell_text:
-                            row_text.append(cell_text)
-                    if row_text:
-                        table_text.append(' | '.join(row_text))
-                return '\n'.join(table_text)
-        except Exception:
-            pass
+            return self._read_shape_text(shape)
+        except Exception as e:
+            logger.debug("Skipping shape whose text could not be read: %s", e)
+            return ""
+    
+    def _read_shape_text(self, shape) -> str:
+        """Read text, text frame or table content of a shape."""
+        # Direct text access; attributes are read once and missing ones
+        # caught, rather than probed with hasattr and then read again
+        try:
+            text = shape.text
+        except AttributeError:
+            text = None
+        if text:
+            return text.strip()
+        
+        # Text frame access
+        try:
+            text_frame = shape.text_frame
+        except (AttributeError, ValueError):
+            text_frame = None
+        if text_frame:
+            text_parts = []
+            for paragraph in text_frame.paragraphs:
+                paragraph_text = ''.join(run.text for run in paragraph.runs if run.text).strip()
+                if paragraph_text:
+                    text_parts.append(paragraph_text)
+            return '\n'.join(text_parts)
+        
+        # Table content (graphic frames without a table raise ValueError)
+        try:
+            table = shape.table
+        except (AttributeError, ValueError):
+            table = None
+        if table:
+            table_text = []
+            for row in table.rows:
+                row_text = []
+                for cell in row.cells:
+                    cell_text = self._extract_shape_text(cell)
+                    if cell_text:
+                        row_text.append(cell_text)
+                if row_text:
+                    table_text.append(' | '.join(row_text))
+            return '\n'.join(table_text)
         return ""
     
     def _extract_notes_text(self, notes_slide) -> str:
@@ -94,14 +119,20 @@ class ContentProcessor:
             return ""
         
         try:
-            # Convert to PIL image
+            import cv2
+            import pytesseract
+            
+            # Straight to 8-bit grayscale; tesseract takes the numpy array as is
             if len(slide_image.shape) == 3 and slide_image.shape[2] == 3:
-                pil_image = Image.fromarray(cv2.cvtColor(slide_image, cv2.COLOR_BGR2RGB))
+                gray = cv2.cvtColor(slide_image, cv2.COLOR_BGR2GRAY, dst=self._gray_buffer(slide_image.shape[:2]))
             else:
-                pil_image = Image.fromarray(slide_image)
+                gray = slide_image
             
             # Enhance image for better OCR
-            enhanced_image = self._enhance_image_for_ocr(pil_image)
+            try:
+                enhanced_image = self._enhance_gray_for_ocr(gray)
+            except Exception:
+                enhanced_image = gray
             
             # Try OCR with custom config first
             try:
@@ -116,29 +147,47 @@ class ContentProcessor:
             return extracted_text.strip()
         
         except Exception as e:
-            print(f"OCR extraction failed: {str(e)}")
+            logger.warning("OCR extraction failed: %s", e)
             return ""
     
-    def _enhance_image_for_ocr(self, pil_image: Image.Image) -> Image.Image:
+    def _enhance_image_for_ocr(self, pil_image: 'Image.Image') -> 'Image.Image':
         """Enhance image quality for better OCR results."""
         try:
-            img_array = np.array(pil_image)
+            import cv2
+            from PIL import Image
+            
+            img_array = np.asarray(pil_image)
             
             # Convert to grayscale if needed
             if len(img_array.shape) == 3:
-                gray = cv2.cvtColor(img_array, cv2.COLOR_RGB2GRAY)
+                gray = cv2.cvtColor(img_array, cv2.COLOR_RGB2GRAY, dst=self._gray_buffer(img_array.shape[:2]))
             else:
                 gray = img_array
             
-            # Apply enhancement techniques
-            enhanced = cv2.convertScaleAbs(gray, alpha=1.2, beta=10)
-            blurred = cv2.GaussianBlur(enhanced, (1, 1), 0)
-            _, thresh = cv2.threshold(blurred, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
-            
-            return Image.fromarray(thresh)
+            return Image.fromarray(self._enhance_gray_for_ocr(gray))
         except Exception:
             return pil_image
     
+    def _enhance_gray_for_ocr(self, gray: np.ndarray) -> np.ndarray:
+        """Contrast-stretch and binarize an 8-bit grayscale image for OCR."""
+        import cv2
+        
+        # In place when gray is the scratch buffer; otherwise into a new array
+        if gray is self._gray_buf:
+            enhanced = cv2.convertScaleAbs(gray, dst=gray, alpha=1.2, beta=10)
+        else:
+            enhanced = cv2.convertScaleAbs(gray, alpha=1.2, beta=10)
+        
+        # Otsu binarization; a (1, 1) Gaussian blur is the identity, so none is applied
+        _, thresh = cv2.threshold(enhanced, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+        return thresh
+    
+    def _gray_buffer(self, shape) -> np.ndarray:
+        """Grayscale scratch buffer, reallocated only when the image size changes."""
+        if self._gray_buf is None or self._gray_buf.shape != shape:
+            self._gray_buf = np.empty(shape, dtype=np.uint8)
+        return self._gray_buf
+    
     def detect_objects_in_slide(self, slide_image: np.ndarray) -> List[Dict]:
         """Detect objects/shapes in slide image."""
         if slide_image is None:
@@ -146,47 +195,67 @@ class ContentProcessor:
         
         objects_detected = []
         
+        # No contour in an image this small can pass the area threshold
+        if slide_image.shape[0] * slide_image.shape[1] <= 100:
+            return []
+        
         try:
+            import cv2
+            
             gray = cv2.cvtColor(slide_image, cv2.COLOR_BGR2GRAY)
+            
+            # Nearly uniform slides (plain backgrounds) have no edges worth
+            # tracing; one statistics pass is cheaper than Canny + contours
+            if cv2.meanStdDev(gray)[1][0][0] < 5.0:
+                return []
+            
             edges = cv2.Canny(gray, 50, 150)
             contours, _ = cv2.findContours(edges, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
             
-            for i, contour in enumerate(contours):
-                if cv2.contourArea(contour) > 100:
-                    x, y, w, h = cv2.boundingRect(contour)
-                    object_info = {
-                        'id': i,
-                        'type': 'detected_shape',
-                        'bounding_box': (x, y, w, h),
-                        'area': cv2.contourArea(contour)
-                    }
-                    objects_detected.append(object_info)
+            # Area of every contour once, threshold as an array, and only
+            # build boxes/dicts for the survivors (most contours are tiny)
+            areas = np.fromiter((cv2.contourArea(c) for c in contours), dtype=np.float64, count=len(contours))
+            for i in np.flatnonzero(areas > 100):
+                x, y, w, h = cv2.boundingRect(contours[i])
+                objects_detected.append({
+                    'id': int(i),
+                    'type': 'detected_shape',
+                    'bounding_box': (x, y, w, h),
+                    'area': float(areas[i])
+                })
         except Exception as e:
-            print(f"Object detection failed: {str(e)}")
+            logger.warning("Object detection failed: %s", e)
         
         return objects_detected
     
-    def slide_to_image(self, slide: Slide, presentation_width: int, presentation_height: int) -> np.ndarray:
+    @classmethod
+    def _get_font(cls):
+        """Arial 24pt, or PIL's default font when it cannot be loaded."""
+        if cls._FONT is None:
+            from PIL import ImageFont
+            try:
+                cls._FONT = ImageFont.truetype("Arial.ttf", 24)
+            except (OSError, ImportError):
+                cls._FONT = ImageFont.load_default()
+        return cls._FONT
+    
+    def slide_to_image(self, slide: 'Slide', presentation_width: int, presentation_height: int) -> np.ndarray:
         """Convert slide to image."""
         try:
             # Use presentation dimensions
             width = int(presentation_width.inches * 96)  # 96 DPI
             height = int(presentation_height.inches * 96)
             
-            # Create white background
-            img = np.ones((height, width, 3), dtype=np.uint8) * 255
-            
             try:
-                import io
-                from PIL import ImageDraw, ImageFont
+                from PIL import Image, ImageDraw
                 
-                pil_image = Image.fromarray(img)
+                # Draw on a white PIL canvas directly: an array shared through
+                # Image.frombuffer is read-only and ImageDraw would copy it anyway
+                pil_image = Image.new('RGB', (width, height), (255, 255, 255))
                 draw = ImageDraw.Draw(pil_image)
-                
-                try:
-                    font = ImageFont.truetype("Arial.ttf", 24)
-                except:
-                    font = ImageFont.load_default()
+                font = self._get_font()
+                # PIL's multiline line spacing; lines past the bottom edge are not drawn
+                line_height = font.getbbox("A")[3] + 4 if hasattr(font, 'getbbox') else None
                 
                 # Extract and render text shapes
                 y_offset = 50
@@ -204,15 +273,22 @@ class ContentProcessor:
                             x = 50
                             y = y_offset
                         
-                        draw.text((x, y), text, fill=(0, 0, 0), font=font)
+                        if line_height:
+                            # Lines starting above the bottom edge: ceil((height - y) / line_height)
+                            lines = text.split('\n')
+                            visible_lines = max(0, -(-(height - y) // line_height))
+                            if len(lines) > visible_lines:
+                                text = '\n'.join(lines[:visible_lines])
+                        
+                        if text:
+                            draw.text((x, y), text, fill=(0, 0, 0), font=font)
                         y_offset += 40
                 
-                img = np.array(pil_image)
+                return np.array(pil_image)
             except Exception:
-                pass
-            
-            return img
+                # White background
+                return np.full((height, width, 3), 255, dtype=np.uint8)
         except Exception as e:
-            print(f"Error in slide_to_image: {str(e)}")
+            logger.warning("Error in slide_to_image: %s", e)
             # Return basic white image as fallback
-            return np.ones((600, 800, 3), dtype=np.uint8) * 255
+            return np.full((600, 800, 3), 255, dtype=np.uint8)
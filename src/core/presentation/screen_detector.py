@@ -1,9 +1,12 @@
+import os
 import platform
 import time
 import re
 from typing import Optional, Dict, List, Tuple, Callable
 import threading
 import hashlib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 
 # Core imports
@@ -14,9 +17,20 @@ from PIL import Image
 
 # Platform-specific imports will be loaded dynamically
 pytesseract = None
+tesserocr = None
+mss = None
+bettercam = None
 win32gui = None
 win32process = None
 psutil = None
+uiautomation = None
+
+# Tesseract's OpenMP threading is slower than serial on slide-sized images and
+# oversubscribes the CPU when several windows are OCR'd in parallel. OpenMP reads
+# OMP_THREAD_LIMIT once per process, so it would also throttle torch/whisper; opt in
+# with QUEPILOT_TESSERACT_SINGLE_THREAD=1 when OCR runs in its own process.
+if os.environ.get("QUEPILOT_TESSERACT_SINGLE_THREAD") == "1":
+    os.environ.setdefault("OMP_THREAD_LIMIT", "1")
 
 @dataclass
 class SlideInfo:
@@ -34,13 +48,45 @@ class PowerPointScreenDetector:
     Complements existing AppleScript and Win32 window detection methods.
     """
 
+    # PowerPoint, Slide Show, .ppt/.pptx, Microsoft PowerPoint, Presentation
+    _POWERPOINT_TITLE_RE = re.compile(r'powerpoint|slide show|\.ppt|presentation', re.IGNORECASE)
+
+    _SLIDE_NUMBER_PATTERNS = tuple(re.compile(p, re.IGNORECASE | re.MULTILINE) for p in (
+        r'Slide\s*(\d+)',
+        r'(\d+)\s*of\s*\d+',
+        r'(\d+)\s*/\s*\d+',
+        r'^(\d+)$',  # Just a number on its own
+    ))
+
+    # Horizontal smear that joins the glyphs of one text line into a single blob
+    _LINE_KERNEL = cv2.getStructuringElement(cv2.MORPH_RECT, (15, 1))
+
+    _OCR_WHITELIST = '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz.,!?;:()[]{}"-\' '
+
     def __init__(self):
         self.system = platform.system()
         self.ppt_windows = []
         self.current_slide_info = None
-        self.previous_content_hash = ""
+        # (image_hash, content_hash) of the last frame seen per PowerPoint window
+        self._window_hashes: Dict[object, Tuple[bytes, bytes]] = {}
+        self.ocr_cache_size = 32
+        self._ocr_cache: "OrderedDict[bytes, Dict]" = OrderedDict()
+        self._ocr_cache_lock = threading.Lock()
         self.monitoring_thread = None
-        self.is_monitoring = False
+        self._stop_event = threading.Event()
+        self._stop_event.set()
+        self._camera = None
+        self._cg_window_list = None
+        self._tess_available = False
+        # (owner thread, tesserocr API) pairs, so stop_monitoring can End() the pool's
+        self._tess_apis = []
+        self._tess_apis_lock = threading.Lock()
+        self._ocr_buffers = threading.local()
+        self.ocr_max_width = 960
+        self.ocr_max_regions = 40
+
+        # Worker pool for monitor_slides, created when monitoring starts
+        self._pool = None
 
         # OCR configuration
         self.ocr_config = r'--oem 3 --psm 6 -c tessedit_char_whitelist=0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz.,!?;:()[]{}"-\' '
@@ -48,9 +94,31 @@ class PowerPointScreenDetector:
         # Import platform-specific modules
         self._initialize_platform_modules()
 
+        # Keep Tesseract loaded instead of spawning a process per call
+        if tesserocr is not None:
+            try:
+                self._tess_api()
+                self._tess_available = True
+            except RuntimeError as e:
+                print(f"Warning: tesserocr failed to initialize, using pytesseract: {e}")
+
+        # mss grabbers hold per-thread display/DC handles, so each capturing thread gets its own
+        self._grabbers = threading.local()
+
+    @property
+    def is_monitoring(self) -> bool:
+        """True while the monitoring loop is running"""
+        return not self._stop_event.is_set()
+
     def _initialize_platform_modules(self):
         """Initialize platform-specific modules"""
-        global pytesseract, win32gui, win32process, psutil
+        global pytesseract, tesserocr, mss, bettercam, win32gui, win32process, psutil, uiautomation
+
+        try:
+            import tesserocr as tocr
+            tesserocr = tocr
+        except ImportError:
+            pass
 
         try:
             import pytesseract as pt
@@ -59,6 +127,12 @@ class PowerPointScreenDetector:
             print("Warning: pytesseract not available. Install with: pip install pytesseract")
             print("Also ensure Tesseract OCR is installed on your system")
 
+        try:
+            import mss as mss_module
+            mss = mss_module
+        except ImportError:
+            print("Warning: mss not available, falling back to pyautogui for capture. Install with: pip install mss")
+
         if self.system == "Windows":
             try:
                 import win32gui as w32gui
@@ -70,6 +144,29 @@ class PowerPointScreenDetector:
             except ImportError:
                 print("Warning: Windows modules not available. Install with: pip install pywin32 psutil")
 
+            # Reading the slide through UI Automation avoids capture and OCR entirely
+            try:
+                import uiautomation as uia
+                uiautomation = uia
+            except ImportError:
+                pass
+
+            # DXGI Desktop Duplication capture, started only while monitoring
+            try:
+                import bettercam as bcam
+                bettercam = bcam
+            except ImportError:
+                pass
+        elif self.system == "Darwin":
+            # Resolve the Quartz bridge once rather than on every window scan
+            try:
+                from Quartz import CGWindowListCopyWindowInfo, kCGWindowListOptionOnScreenOnly, kCGNullWindowID
+                self._cg_window_list = CGWindowListCopyWindowInfo
+                self._cg_opts = kCGWindowListOptionOnScreenOnly
+                self._cg_null = kCGNullWindowID
+            except ImportError:
+                self._cg_window_list = None
+
     def find_powerpoint_windows(self) -> List[Dict]:
         """Find all PowerPoint windows using platform-specific methods"""
         if self.system == "Windows":
@@ -113,49 +210,46 @@ class PowerPointScreenDetector:
 
     def _find_macos_powerpoint(self) -> List[Dict]:
         """Find PowerPoint windows on macOS using Quartz"""
-        try:
-            from Quartz import CGWindowListCopyWindowInfo, kCGWindowListOptionOnScreenOnly, kCGNullWindowID
-
-            windows = []
-            window_list = CGWindowListCopyWindowInfo(kCGWindowListOptionOnScreenOnly, kCGNullWindowID)
-
-            for window_info in window_list:
-                window_title = window_info.get('kCGWindowName', '')
-                owner_name = window_info.get('kCGWindowOwnerName', '')
-
-                if self._is_powerpoint_window(window_title) or owner_name == 'Microsoft PowerPoint':
-                    bounds = window_info.get('kCGWindowBounds', {})
-                    if bounds.get('Width', 0) > 400:  # Filter out small windows
-                        windows.append({
-                            'title': window_title,
-                            'rect': (bounds.get('X', 0), bounds.get('Y', 0),
-                                   bounds.get('X', 0) + bounds.get('Width', 0),
-                                   bounds.get('Y', 0) + bounds.get('Height', 0)),
-                            'process': owner_name,
-                            'area': bounds.get('Width', 0) * bounds.get('Height', 0)
-                        })
-
-            self.ppt_windows = windows
-            return windows
-        except ImportError:
+        if self._cg_window_list is None:
             print("macOS window detection requires pyobjc-framework-Quartz")
             return []
 
-    def _is_powerpoint_window(self, window_title: str) -> bool:
-        """Check if a window title indicates PowerPoint"""
-        if not window_title:
-            return False
+        window_list = self._cg_window_list(self._cg_opts, self._cg_null) or ()
 
-        powerpoint_indicators = [
-            'PowerPoint', 'Slide Show', '.ppt', '.pptx',
-            'Microsoft PowerPoint', 'Presentation'
+        # Pull the fields out of each Obj-C dictionary once
+        candidates = [
+            (window_info.get('kCGWindowNumber'), window_info.get('kCGWindowName') or '',
+             window_info.get('kCGWindowOwnerName') or '', window_info.get('kCGWindowBounds') or {})
+            for window_info in window_list
         ]
 
-        title_lower = window_title.lower()
-        return any(indicator.lower() in title_lower for indicator in powerpoint_indicators)
+        windows = []
+        for window_id, window_title, owner_name, bounds in candidates:
+            if owner_name == 'Microsoft PowerPoint' or self._is_powerpoint_window(window_title):
+                x, y = bounds.get('X', 0), bounds.get('Y', 0)
+                width, height = bounds.get('Width', 0), bounds.get('Height', 0)
+                if width > 400:  # Filter out small windows
+                    windows.append({
+                        'window_id': window_id,
+                        'title': window_title,
+                        'rect': (x, y, x + width, y + height),
+                        'process': owner_name,
+                        'area': width * height
+                    })
 
-    def capture_slide_area(self, window_info: Dict) -> Tuple[np.ndarray, Image.Image]:
-        """Capture the slide area from PowerPoint window"""
+        self.ppt_windows = windows
+        return windows
+
+    def _is_powerpoint_window(self, window_title: str) -> bool:
+        """Check if a window title indicates PowerPoint"""
+        return bool(window_title and self._POWERPOINT_TITLE_RE.search(window_title))
+
+    def capture_slide_area(self, window_info: Dict) -> Tuple[np.ndarray, np.ndarray, Image.Image]:
+        """Capture the slide area from PowerPoint window.
+
+        Returns (bgr_image, gray_image, pil_image). Grayscale is converted once
+        straight from the raw capture; the BGR image is a view of that buffer.
+        """
         left, top, right, bottom = window_info['rect']
 
         # Add some padding to ensure we capture the full content
@@ -166,23 +260,105 @@ class PowerPointScreenDetector:
                  max(1, bottom - top - 2*padding))
 
         try:
+            if self._camera is not None:
+                frame = self._camera.get_latest_frame()
+                # The camera captures the primary output only; windows on other monitors use mss
+                if (frame is not None and left >= 0 and top >= 0
+                        and right <= frame.shape[1] and bottom <= frame.shape[0]):
+                    x, y, width, height = region
+                    crop = frame[y:y + height, x:x + width]
+                    if crop.size:
+                        gray = cv2.cvtColor(crop, cv2.COLOR_BGR2GRAY, dst=self._capture_gray(crop.shape))
+                        screenshot = Image.fromarray(cv2.cvtColor(crop, cv2.COLOR_BGR2RGB))
+                        return crop, gray, screenshot
+
+            sct = self._grabber()
+            if sct is not None:
+                raw = sct.grab({'left': region[0], 'top': region[1],
+                                      'width': region[2], 'height': region[3]})
+
+                # mss returns physical pixels (2x the requested size on Retina),
+                # so size everything from the grab itself. BGRA -> BGR is just a view.
+                bgra = np.frombuffer(raw.bgra, dtype=np.uint8).reshape(raw.height, raw.width, 4)
+                gray = cv2.cvtColor(bgra, cv2.COLOR_BGRA2GRAY, dst=self._capture_gray(bgra.shape))
+                screenshot = Image.frombuffer('RGB', (bgra.shape[1], bgra.shape[0]), bgra, 'raw', 'BGRX', 0, 1)
+
+                return bgra[:, :, :3], gray, screenshot
+
             # Capture screenshot of the window area
             screenshot = pyautogui.screenshot(region=region)
 
             # Convert to OpenCV format
-            opencv_image = cv2.cvtColor(np.array(screenshot), cv2.COLOR_RGB2BGR)
+            rgb = np.asarray(screenshot)
+            gray = cv2.cvtColor(rgb, cv2.COLOR_RGB2GRAY, dst=self._capture_gray(rgb.shape))
 
-            return opencv_image, screenshot
+            return rgb[:, :, ::-1], gray, screenshot
         except Exception as e:
             print(f"Failed to capture screen area: {e}")
             # Return a small black image as fallback
             fallback_img = np.zeros((100, 100, 3), dtype=np.uint8)
             fallback_pil = Image.fromarray(fallback_img)
-            return fallback_img, fallback_pil
+            return fallback_img, np.zeros((100, 100), dtype=np.uint8), fallback_pil
 
-    def extract_slide_content(self, image: np.ndarray) -> Dict:
-        """Extract text from slide using OCR"""
-        if pytesseract is None:
+    def _start_camera(self):
+        """Start a bettercam capture session for monitoring (Windows, when installed)"""
+        if bettercam is None or self._camera is not None:
+            return
+        try:
+            self._camera = bettercam.create(output_color="BGR")
+            self._camera.start(target_fps=5, video_mode=True)
+        except Exception as e:
+            print(f"Warning: bettercam unavailable, using mss for capture: {e}")
+            self._camera = None
+
+    def _stop_camera(self):
+        """Stop the bettercam session; the next monitor_slides starts a new one"""
+        if self._camera is None:
+            return
+        # bettercam can crash joining its capture thread; never let that escape
+        try:
+            self._camera.stop()
+        except Exception as e:
+            print(f"Failed to stop bettercam capture: {e}")
+        self._camera = None
+
+    def _grabber(self):
+        """This thread's reusable mss grabber, or None when mss isn't installed"""
+        if mss is None:
+            return None
+        sct = getattr(self._grabbers, 'sct', None)
+        if sct is None:
+            sct = self._grabbers.sct = mss.mss()
+        return sct
+
+    def _capture_gray(self, shape) -> np.ndarray:
+        """Reused grayscale capture buffer; reallocated only when the window size changes"""
+        return self._ocr_buffer('capture_gray', shape[:2])
+
+    def _image_hash(self, gray: np.ndarray) -> bytes:
+        """Cheap perceptual hash of a captured frame (32x32 grayscale)"""
+        thumb = cv2.resize(gray, (32, 32), interpolation=cv2.INTER_AREA)
+        return hashlib.blake2b(thumb.tobytes(), digest_size=16).digest()
+
+    def _cached_slide_content(self, gray: np.ndarray, image_hash: bytes) -> Dict:
+        """OCR the frame unless an identical frame was already recognized (revisited slides)"""
+        with self._ocr_cache_lock:
+            content = self._ocr_cache.get(image_hash)
+            if content is not None:
+                self._ocr_cache.move_to_end(image_hash)
+                return content
+
+        content = self.extract_slide_content(gray)
+        if content['words']:  # Don't cache OCR errors or blank frames
+            with self._ocr_cache_lock:
+                self._ocr_cache[image_hash] = content
+                if len(self._ocr_cache) > self.ocr_cache_size:
+                    self._ocr_cache.popitem(last=False)
+        return content
+
+    def extract_slide_content(self, gray: np.ndarray) -> Dict:
+        """Extract text from a grayscale slide capture using OCR"""
+        if pytesseract is None and not self._tess_available:
             return {
                 'text': 'OCR not available',
                 'words': [],
@@ -191,25 +367,22 @@ class PowerPointScreenDetector:
             }
 
         try:
-            # Convert to grayscale for better OCR
-            gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-
-            # Apply image processing to improve OCR
-            # Adaptive thresholding works better than simple binary threshold
-            processed = cv2.adaptiveThreshold(
-                gray, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, 11, 2
-            )
+            if gray.ndim == 3:
+                gray = cv2.cvtColor(gray, cv2.COLOR_BGR2GRAY)
 
-            # Apply slight blur to reduce noise
-            processed = cv2.medianBlur(processed, 3)
+            processed, scale = self._preprocess_for_ocr(gray)
 
-            # Extract text using Tesseract
-            text = pytesseract.image_to_string(processed, config=self.ocr_config)
+            if self._tess_available:
+                # Text, boxes and confidences from a single recognition pass
+                text, data = self._ocr_with_tesserocr(processed)
+            else:
+                # Extract text using Tesseract
+                text = pytesseract.image_to_string(processed, config=self.ocr_config)
 
-            # Get detailed information including coordinates and confidence
-            data = pytesseract.image_to_data(processed, output_type=pytesseract.Output.DICT)
+                # Get detailed information including coordinates and confidence
+                data = pytesseract.image_to_data(processed, output_type=pytesseract.Output.DICT)
 
-            words = self._extract_words_with_positions(data)
+            words, title_line = self._extract_words_with_positions(data, scale)
             lines = self._extract_lines(data)
 
             # Calculate overall confidence
@@ -220,6 +393,7 @@ class PowerPointScreenDetector:
                 'text': text.strip(),
                 'words': words,
                 'lines': lines,
+                'title_line': title_line,
                 'confidence': avg_confidence
             }
 
@@ -232,89 +406,240 @@ class PowerPointScreenDetector:
                 'confidence': 0.0
             }
 
-    def _extract_words_with_positions(self, data: Dict) -> List[Dict]:
-        """Extract words with their positions and confidence scores"""
-        words = []
-        n_boxes = len(data['level'])
-
-        for i in range(n_boxes):
-            confidence = int(data['conf'][i])
-            if confidence > 30:  # Lower threshold for better detection
-                text = data['text'][i].strip()
-                if text:  # Only include non-empty text
-                    word = {
-                        'text': text,
-                        'x': data['left'][i],
-                        'y': data['top'][i],
-                        'width': data['width'][i],
-                        'height': data['height'][i],
-                        'confidence': confidence
-                    }
-                    words.append(word)
-
-        return words
+    def _ocr_buffer(self, name: str, shape) -> np.ndarray:
+        """Per-thread uint8 work buffer, reallocated only when the frame size changes"""
+        buf = getattr(self._ocr_buffers, name, None)
+        if buf is None or buf.shape != shape:
+            buf = np.empty(shape, dtype=np.uint8)
+            setattr(self._ocr_buffers, name, buf)
+        return buf
+
+    def _preprocess_for_ocr(self, gray: np.ndarray) -> Tuple[np.ndarray, float]:
+        """Downscale, adaptive threshold and median blur into reused buffers.
+
+        Returns the processed image and the scale applied to it.
+        """
+        height, width = gray.shape[:2]
+
+        # Slide text is far larger than Tesseract needs; recognition cost is linear in pixels
+        scale = min(1.0, self.ocr_max_width / width)
+        if scale < 1.0:
+            size = (max(1, int(width * scale)), max(1, int(height * scale)))
+            gray = cv2.resize(gray, size, dst=self._ocr_buffer('small', size[::-1]),
+                              interpolation=cv2.INTER_AREA)
+
+        # Adaptive thresholding works better than simple binary threshold
+        processed = cv2.adaptiveThreshold(
+            gray, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, 11, 2,
+            dst=self._ocr_buffer('thresh', gray.shape)
+        )
+
+        # Apply slight blur to reduce noise
+        return cv2.medianBlur(processed, 3, dst=self._ocr_buffer('blur', gray.shape)), scale
+
+    def _tess_api(self):
+        """Per-thread tesserocr API (PyTessBaseAPI is not thread-safe), created on first use"""
+        api = getattr(self._ocr_buffers, 'tess', None)
+        if api is None:
+            api = tesserocr.PyTessBaseAPI(psm=tesserocr.PSM.SINGLE_BLOCK, oem=tesserocr.OEM.DEFAULT)
+            api.SetVariable("tessedit_char_whitelist", self._OCR_WHITELIST)
+            self._ocr_buffers.tess = api
+            with self._tess_apis_lock:
+                self._tess_apis.append((threading.current_thread(), api))
+        return api
+
+    def _close_tess_apis(self):
+        """End() the tesserocr APIs of threads that have exited, e.g. a shut-down pool's workers.
+
+        A live thread may be mid-recognition (get_current_slide_info callers), so its
+        API is left alone; only its owner ever uses it.
+        """
+        with self._tess_apis_lock:
+            finished = [api for thread, api in self._tess_apis if not thread.is_alive()]
+            self._tess_apis = [(thread, api) for thread, api in self._tess_apis if thread.is_alive()]
+        for api in finished:
+            api.End()
+
+    def _text_regions(self, processed: np.ndarray) -> List[Tuple[int, int, int, int]]:
+        """Line-shaped text regions (x, y, w, h), top to bottom, found as connected ink blobs"""
+        # Smear dark glyphs sideways so each text line becomes one external contour
+        ink = cv2.dilate(cv2.bitwise_not(processed), self._LINE_KERNEL)
+        contours, _ = cv2.findContours(ink, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+        boxes = sorted((box for box in map(cv2.boundingRect, contours) if box[2] >= 8 and box[3] >= 6),
+                       key=lambda box: (box[1], box[0]))
+
+        # Merge overlapping rectangles
+        regions = []
+        for x, y, w, h in boxes:
+            for i, (rx, ry, rw, rh) in enumerate(regions):
+                if x < rx + rw and rx < x + w and y < ry + rh and ry < y + h:
+                    nx, ny = min(x, rx), min(y, ry)
+                    regions[i] = (nx, ny, max(x + w, rx + rw) - nx, max(y + h, ry + rh) - ny)
+                    break
+            else:
+                regions.append((x, y, w, h))
+        return regions
+
+    def _ocr_with_tesserocr(self, processed: np.ndarray) -> Tuple[str, Dict]:
+        """Run the persistent tesserocr API and return text plus image_to_data-style word data.
+
+        Slides are mostly sparse lines (title, bullets, footer), so each text region is
+        recognized as a single line (PSM 7), skipping Tesseract's page layout analysis.
+        Pages that don't split into a modest number of line-shaped regions are read
+        whole with PSM 6.
+        """
+        data = {key: [] for key in ('level', 'block_num', 'par_num', 'line_num', 'word_num',
+                                    'left', 'top', 'width', 'height', 'conf', 'text')}
+
+        api = self._tess_api()
+        api.SetImage(Image.fromarray(processed))
+
+        regions = self._text_regions(processed)
+        max_line_height = processed.shape[0] // 4
+        if 0 < len(regions) <= self.ocr_max_regions and all(h <= max_line_height for _, _, _, h in regions):
+            api.SetPageSegMode(tesserocr.PSM.SINGLE_LINE)
+            texts = []
+            block = 0
+            for x, y, w, h in regions:
+                api.SetRectangle(x, y, w, h)
+                line_text = api.GetUTF8Text().strip()
+                if line_text:
+                    texts.append(line_text)
+                block = self._append_tess_words(api, data, block)
+            return '\n'.join(texts), data
+
+        api.SetPageSegMode(tesserocr.PSM.SINGLE_BLOCK)
+        text = api.GetUTF8Text()
+        self._append_tess_words(api, data, 0)
+        return text, data
+
+    def _append_tess_words(self, api, data: Dict, block: int) -> int:
+        """Append the last recognition's words to data; returns the running block number"""
+        ril = tesserocr.RIL
+        par = line = word_num = 0
+
+        iterator = api.GetIterator()
+        if iterator is None:
+            return block
+
+        for item in tesserocr.iterate_level(iterator, ril.WORD):
+            word = item.GetUTF8Text(ril.WORD)
+            box = item.BoundingBox(ril.WORD)
+            if word is None or box is None:
+                continue
+
+            if item.IsAtBeginningOf(ril.BLOCK):
+                block, par, line = block + 1, 0, 0
+            if item.IsAtBeginningOf(ril.PARA):
+                par, line = par + 1, 0
+            if item.IsAtBeginningOf(ril.TEXTLINE):
+                line, word_num = line + 1, 0
+            word_num += 1
+
+            x1, y1, x2, y2 = box
+            data['level'].append(5)  # Word level, as in image_to_data
+            data['block_num'].append(block)
+            data['par_num'].append(par)
+            data['line_num'].append(line)
+            data['word_num'].append(word_num)
+            data['left'].append(x1)
+            data['top'].append(y1)
+            data['width'].append(x2 - x1)
+            data['height'].append(y2 - y1)
+            data['conf'].append(int(item.Confidence(ril.WORD)))
+            data['text'].append(word)
+
+        return block
+
+    def _confident_word_mask(self, data: Dict) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return confidences, stripped texts and a mask of confident, non-empty OCR boxes"""
+        conf = np.asarray(data['conf'], dtype=np.float64).astype(np.int32)
+        texts = np.char.strip(np.asarray(data['text'], dtype=str))
+        mask = (conf > 30) & (np.char.str_len(texts) > 0)  # Lower threshold for better detection
+        return conf, texts, mask
+
+    def _extract_words_with_positions(self, data: Dict, scale: float = 1.0) -> Tuple[List[Dict], Optional[str]]:
+        """Extract words with their positions (in captured-image pixels) and confidence scores.
+
+        The likely title line is computed from the same arrays and returned alongside.
+        """
+        if not data['level']:
+            return [], None
+
+        conf, texts, mask = self._confident_word_mask(data)
+        idx = np.flatnonzero(mask)
+        if not idx.size:
+            return [], None
+
+        boxes = np.array([data['left'], data['top'], data['width'], data['height']])[:, idx]
+        if scale != 1.0:
+            # Map boxes from the downscaled OCR image back to capture coordinates
+            boxes = np.rint(boxes / scale).astype(np.int64)
+        word_texts = texts[idx]
+
+        # Title: topmost 20-pixel band among words in the top 30% of the image, left to right
+        title_line = None
+        xs, ys = boxes[0], boxes[1]
+        top_mask = ys < ys.max() * 0.3
+        if top_mask.any():
+            bands = ys // 20
+            line_idx = np.flatnonzero(top_mask & (bands == bands[top_mask].min()))
+            line_idx = line_idx[np.argsort(xs[line_idx], kind='stable')]
+            title_line = ' '.join(word_texts[line_idx].tolist())
+
+        left, top, width, height = boxes.tolist()
+        words = [
+            {'text': text, 'x': x, 'y': y, 'width': w, 'height': h, 'confidence': c}
+            for text, x, y, w, h, c in zip(word_texts.tolist(), left, top, width, height,
+                                           conf[idx].tolist())
+        ]
+        return words, title_line
 
     def _extract_lines(self, data: Dict) -> List[str]:
         """Extract text lines from OCR data"""
-        lines = []
-        current_line = []
-        current_y = -1
-
-        for i, level in enumerate(data['level']):
-            if level == 4:  # Word level
-                confidence = int(data['conf'][i])
-                if confidence > 30:
-                    text = data['text'][i].strip()
-                    y_pos = data['top'][i]
-
-                    # If this word is on a significantly different Y position, start new line
-                    if current_y >= 0 and abs(y_pos - current_y) > 10:
-                        if current_line:
-                            lines.append(' '.join(current_line))
-                            current_line = []
+        if not data['level']:
+            return []
 
-                    if text:
-                        current_line.append(text)
-                        current_y = y_pos
+        _, texts, mask = self._confident_word_mask(data)
+        # image_to_data levels: 1 page, 2 block, 3 paragraph, 4 line, 5 word
+        mask &= np.asarray(data['level']) == 5
+        idx = np.flatnonzero(mask)
+        if not idx.size:
+            return []
 
-        # Add the last line
-        if current_line:
-            lines.append(' '.join(current_line))
+        # Tesseract's own block/paragraph/line numbering marks where each line starts
+        line_ids = (np.asarray(data['block_num'], dtype=np.int64)[idx] * 1_000_000
+                    + np.asarray(data['par_num'], dtype=np.int64)[idx] * 1_000
+                    + np.asarray(data['line_num'], dtype=np.int64)[idx])
+        breaks = np.flatnonzero(np.diff(line_ids)) + 1
 
-        return lines
+        return [' '.join(group.tolist()) for group in np.split(texts[idx], breaks)]
 
     def detect_slide_number(self, content: Dict) -> Optional[int]:
         """Try to detect slide number from the extracted content"""
         text = content['text']
 
-        # Look for slide number patterns
-        number_patterns = [
-            r'Slide\s*(\d+)',
-            r'(\d+)\s*of\s*\d+',
-            r'(\d+)\s*/\s*\d+',
-            r'^(\d+)$',  # Just a number on its own
-        ]
-
-        for pattern in number_patterns:
-            match = re.search(pattern, text, re.IGNORECASE | re.MULTILINE)
+        # Look for slide number patterns, in order of precedence
+        for pattern in self._SLIDE_NUMBER_PATTERNS:
+            match = pattern.search(text)
             if match:
-                try:
-                    return int(match.group(1))
-                except (ValueError, IndexError):
-                    continue
+                return int(match.group(1))
 
         # Look in the bottom area words for slide numbers
         words = content['words']
         if words:
-            # Sort words by Y position (bottom to top)
-            bottom_words = sorted([w for w in words if w['confidence'] > 60],
-                                key=lambda w: w['y'], reverse=True)
-
-            # Check the bottom 20% of words
-            bottom_count = max(1, len(bottom_words) // 5)
-            for word in bottom_words[:bottom_count]:
-                if word['text'].isdigit():
-                    num = int(word['text'])
+            confs = np.fromiter((w['confidence'] for w in words), dtype=np.float64, count=len(words))
+            confident = np.flatnonzero(confs > 60)
+            if confident.size:
+                ys = np.fromiter((w['y'] for w in words), dtype=np.int64, count=len(words))
+
+                # Bottom 20% of confident words, bottom to top (stable, like sorted(reverse=True))
+                bottom_count = max(1, confident.size // 5)
+                bottom = confident[np.argsort(-ys[confident], kind='stable')[:bottom_count]]
+
+                texts = np.array([words[i]['text'] for i in bottom.tolist()], dtype=str)
+                for text in texts[np.char.isdigit(texts)].tolist():
+                    num = int(text)
                     if 1 <= num <= 999:  # Reasonable slide number range
                         return num
 
@@ -326,9 +651,11 @@ class PowerPointScreenDetector:
         if not lines:
             return "No Title Found"
 
-        # Try to find the title (usually first non-empty line, large font)
+        # Try to find the title (usually first non-empty line, large font);
+        # extract_slide_content already picked it out while building the word list
+        title = content.get('title_line')
         words = content['words']
-        if words:
+        if title is None and words:
             # Find words in the top 30% of the image
             top_words = [w for w in words if w['y'] < (max(w['y'] for w in words) * 0.3)]
             if top_words:
@@ -341,12 +668,12 @@ class PowerPointScreenDetector:
                     line_groups[y_key].append(word)
 
                 # Find the topmost line with reasonable text
-                if line_groups:
-                    top_line = min(line_groups.keys())
-                    title_words = sorted(line_groups[top_line], key=lambda w: w['x'])
-                    title = ' '.join(w['text'] for w in title_words)
-                    if len(title.strip()) > 0 and len(title) < 150:
-                        return title.strip()
+                top_line = min(line_groups.keys())
+                title_words = sorted(line_groups[top_line], key=lambda w: w['x'])
+                title = ' '.join(w['text'] for w in title_words)
+
+        if title and len(title.strip()) > 0 and len(title) < 150:
+            return title.strip()
 
         # Fall back to first line
         for line in lines:
@@ -356,61 +683,167 @@ class PowerPointScreenDetector:
 
         return "No Title Found"
 
+    def _get_slide_via_uia(self, window: Dict) -> Optional[Dict]:
+        """Read the slide pane's text through UI Automation (Windows, Normal view).
+
+        Returns content shaped like extract_slide_content, or None when the
+        pane isn't exposed (e.g. slide show) so the caller falls back to OCR.
+        """
+        if uiautomation is None or 'hwnd' not in window:
+            return None
+
+        try:
+            with uiautomation.UIAutomationInitializerInThread():
+                root = uiautomation.ControlFromHandle(window['hwnd'])
+                pane = root.PaneControl(ClassName='paneClassDC', searchDepth=8) if root else None
+                if pane is None or not pane.Exists(0, 0):
+                    return None
+
+                left, top = window['rect'][:2]
+                words = []
+                for control, _ in uiautomation.WalkControl(pane, maxDepth=12):
+                    if control.ControlType != uiautomation.ControlType.TextControl:
+                        continue
+                    text = (control.Name or '').strip()
+                    if not text:
+                        continue
+                    rect = control.BoundingRectangle
+                    words.append({
+                        'text': text,
+                        'x': rect.left - left,
+                        'y': rect.top - top,
+                        'width': rect.width(),
+                        'height': rect.height(),
+                        'confidence': 100
+                    })
+        except Exception as e:
+            print(f"UI Automation read failed, falling back to OCR: {e}")
+            return None
+
+        if not words:
+            return None
+
+        lines = [line.strip() for w in words for line in w['text'].splitlines() if line.strip()]
+        return {
+            'text': '\n'.join(w['text'] for w in words),
+            'words': words,
+            'lines': lines,
+            'confidence': 100.0
+        }
+
+    def _window_key(self, window: Dict):
+        """Stable identity of a window: HWND on Windows, CGWindowNumber on macOS"""
+        return window.get('hwnd') or window.get('window_id') or window['title']
+
+    def _process_window(self, window: Dict) -> Tuple[bytes, bytes, Optional[SlideInfo]]:
+        """Read one PowerPoint window.
+
+        Returns the new (image_hash, content_hash) for the window and its SlideInfo
+        if the slide changed. Runs on pool workers, so it only reads _window_hashes;
+        the monitor thread stores the returned hashes.
+        """
+        previous_image_hash, previous_content_hash = self._window_hashes.get(
+            self._window_key(window), (b"", b""))
+
+        image_hash = previous_image_hash
+        content = self._get_slide_via_uia(window)
+        if content is None:
+            # Capture and process the window
+            image, gray, pil_image = self.capture_slide_area(window)
+
+            # Skip OCR while the frame itself is unchanged
+            image_hash = self._image_hash(gray)
+            if image_hash == previous_image_hash:
+                return previous_image_hash, previous_content_hash, None
+
+            content = self._cached_slide_content(gray, image_hash)
+
+        # Create content hash to ignore OCR jitter
+        content_hash = hashlib.blake2b(content['text'].encode('utf-8', 'ignore'), digest_size=8).digest()
+
+        if content_hash == previous_content_hash or not content['text'].strip():
+            return image_hash, previous_content_hash, None
+
+        return image_hash, content_hash, SlideInfo(
+            slide_number=self.detect_slide_number(content),
+            title=self.extract_title(content),
+            content=content['text'],
+            words=content['words'],
+            timestamp=time.time(),
+            window_title=window['title'],
+            confidence_score=content['confidence']
+        )
+
+    def _window_priority(self, window: Dict) -> Tuple[bool, int]:
+        """Sort key for the window to track: slideshow windows first, then the largest"""
+        return 'Slide Show' in window['title'], window['area']
+
     def monitor_slides(self, callback: Callable[[SlideInfo], None], interval: float = 2.0):
-        """Monitor slide changes and call callback when changes detected"""
+        """Monitor slide changes and call callback when changes detected.
+
+        Every PowerPoint window (e.g. presenter view and slide show) is processed
+        in parallel; of the windows whose slide changed, the slideshow (else the
+        largest) one becomes the current slide and is reported once. Calling it
+        while monitoring is already running returns the running thread.
+        """
+        if self.is_monitoring:
+            return self.monitoring_thread
+
         def monitor_loop():
             print(f"Starting PowerPoint screen monitoring (interval: {interval}s)")
-            self.is_monitoring = True
 
-            while self.is_monitoring:
+            while not self._stop_event.is_set():
+                started = time.monotonic()
                 try:
                     windows = self.find_powerpoint_windows()
-
-                    if windows:
+                    futures = {self._pool.submit(self._process_window, window): window for window in windows}
+
+                    # Workers only read _window_hashes; the new map is swapped in once all are done,
+                    # which also forgets windows that have closed
+                    hashes = {}
+                    changed = []
+                    for future in as_completed(futures):
+                        window = futures[future]
+                        key = self._window_key(window)
+                        try:
+                            image_hash, content_hash, slide_info = future.result()
+                        except Exception as e:
+                            print(f"Error processing PowerPoint window: {e}")
+                            if key in self._window_hashes:
+                                hashes[key] = self._window_hashes[key]
+                            continue
+
+                        hashes[key] = (image_hash, content_hash)
+                        if slide_info:
+                            changed.append((window, slide_info))
+
+                    self._window_hashes = hashes
+
+                    if changed:
                         # Prioritize slideshow windows, otherwise take the largest
-                        target_window = None
-                        for window in windows:
-                            if 'Slide Show' in window['title']:
-                                target_window = window
-                                break
-
-                        if not target_window:
-                            target_window = max(windows, key=lambda w: w['area'])
-
-                        # Capture and process the window
-                        image, pil_image = self.capture_slide_area(target_window)
-                        content = self.extract_slide_content(image)
-
-                        # Create content hash to detect changes
-                        content_hash = hashlib.md5(content['text'].encode()).hexdigest()
-
-                        if content_hash != self.previous_content_hash and content['text'].strip():
-                            slide_number = self.detect_slide_number(content)
-                            title = self.extract_title(content)
-
-                            slide_info = SlideInfo(
-                                slide_number=slide_number,
-                                title=title,
-                                content=content['text'],
-                                words=content['words'],
-                                timestamp=time.time(),
-                                window_title=target_window['title'],
-                                confidence_score=content['confidence']
-                            )
-
-                            self.current_slide_info = slide_info
-                            self.previous_content_hash = content_hash
-
-                            # Call the callback
-                            if callback:
-                                callback(slide_info)
+                        _, slide_info = max(changed, key=lambda item: self._window_priority(item[0]))
+                        self.current_slide_info = slide_info
+
+                        # Call the callback
+                        if callback:
+                            callback(slide_info)
 
                 except Exception as e:
                     print(f"Error in monitoring loop: {e}")
 
-                time.sleep(interval)
+                # Pace to the interval, counting the time this pass already took
+                self._stop_event.wait(max(0.0, interval - (time.monotonic() - started)))
+
+        # Each PowerPoint window is captured and OCR'd on its own worker; Tesseract
+        # releases the GIL, and coordination overhead dominates past ~4 workers
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=min(4, os.cpu_count() or 1),
+                                            thread_name_prefix="ppt-screen")
+
+        self._start_camera()
 
         # Start monitoring in separate thread
+        self._stop_event.clear()
         self.monitoring_thread = threading.Thread(target=monitor_loop, daemon=True)
         self.monitoring_thread.start()
 
@@ -418,9 +851,21 @@ class PowerPointScreenDetector:
 
     def stop_monitoring(self):
         """Stop the monitoring thread"""
-        self.is_monitoring = False
-        if self.monitoring_thread and self.monitoring_thread.is_alive():
-            self.monitoring_thread.join(timeout=5)
+        self._stop_event.set()
+        # Wait out the current pass so the loop submits nothing to a shut-down pool
+        # (a callback stopping the monitor runs on the loop thread, which exits next)
+        if (self.monitoring_thread and self.monitoring_thread.is_alive()
+                and self.monitoring_thread is not threading.current_thread()):
+            self.monitoring_thread.join()
+
+        # Let in-flight OCR finish, then release the workers' Tesseract instances
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+        if self._tess_available:
+            self._close_tess_apis()
+
+        self._stop_camera()
 
     def get_current_slide_info(self) -> Optional[SlideInfo]:
         """Get current slide information (one-time capture)"""
@@ -429,19 +874,14 @@ class PowerPointScreenDetector:
         if not windows:
             return None
 
-        # Prioritize slideshow windows
-        target_window = None
-        for window in windows:
-            if 'Slide Show' in window['title']:
-                target_window = window
-                break
-
-        if not target_window:
-            target_window = max(windows, key=lambda w: w['area'])
+        # Prioritize slideshow windows, otherwise take the largest
+        target_window = max(windows, key=self._window_priority)
 
         try:
-            image, pil_image = self.capture_slide_area(target_window)
-            content = self.extract_slide_content(image)
+            content = self._get_slide_via_uia(target_window)
+            if content is None:
+                image, gray, pil_image = self.capture_slide_area(target_window)
+                content = self._cached_slide_content(gray, self._image_hash(gray))
 
             slide_number = self.detect_slide_number(content)
             title = self.extract_title(content)
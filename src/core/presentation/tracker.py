@@ -272,12 +272,9 @@ class PresentationTracker:
             if hasattr(shape, 'text_frame') and shape.text_frame:
                 text_parts = []
                 for paragraph in shape.text_frame.paragraphs:
-                    paragraph_text = ""
-                    for run in paragraph.runs:
-                        if run.text:
-                            paragraph_text += run.text
-                    if paragraph_text.strip():
-                        text_parts.append(paragraph_text.strip())
+                    paragraph_text = ''.join(run.text for run in paragraph.runs if run.text).strip()
+                    if paragraph_text:
+                        text_parts.append(paragraph_text)
                 return '\n'.join(text_parts)
 
             # Check for table content
@@ -340,17 +337,13 @@ class PresentationTracker:
             width = int(self.presentation.slide_width.inches * 96)  # 96 DPI for better quality
             height = int(self.presentation.slide_height.inches * 96)
 
-            # Create white background
-            img = np.ones((height, width, 3), dtype=np.uint8) * 255
-
             # Try to extract shapes and render them (simplified approach)
             # This is a basic implementation - for full rendering, you'd need more complex logic
             try:
-                import io
                 from PIL import Image, ImageDraw, ImageFont
 
-                # Create PIL image for drawing
-                pil_image = Image.fromarray(img)
+                # Create a white PIL canvas for drawing (filled in one pass)
+                pil_image = Image.new('RGB', (width, height), (255, 255, 255))
                 draw = ImageDraw.Draw(pil_image)
 
                 # Try to get a default font
@@ -382,21 +375,19 @@ class PresentationTracker:
                         draw.text((x, y), text, fill=(0, 0, 0), font=font)
                         y_offset += 40
 
-                # Convert back to numpy array
-                img = np.array(pil_image)
+                # Convert to numpy array
+                return np.array(pil_image)
 
             except Exception as text_render_error:
-                # If text rendering fails, still return the white background
-                pass
-
-            return img
+                # If text rendering fails, still return a white background
+                return np.full((height, width, 3), 255, dtype=np.uint8)
 
         except Exception as e:
             print(f"Error in _slide_to_image: {str(e)}")
             # Return a basic white image as fallback
             width = 800
             height = 600
-            return np.ones((height, width, 3), dtype=np.uint8) * 255
+            return np.full((height, width, 3), 255, dtype=np.uint8)
 
     def extract_text_with_ocr(self, slide_index: Optional[int] = None) -> str:
         """Extract text using OCR with improved image preprocessing"""
@@ -405,15 +396,18 @@ class PresentationTracker:
             return ""
 
         try:
-            # Convert to PIL image with proper color handling
+            # Straight from BGR to grayscale; tesseract takes numpy arrays,
+            # so no PIL conversion is needed
             if len(slide_image.shape) == 3 and slide_image.shape[2] == 3:
-                # BGR to RGB conversion for OpenCV images
-                pil_image = Image.fromarray(cv2.cvtColor(slide_image, cv2.COLOR_BGR2RGB))
+                gray = cv2.cvtColor(slide_image, cv2.COLOR_BGR2GRAY)
             else:
-                pil_image = Image.fromarray(slide_image)
+                gray = slide_image
 
             # Enhance image for better OCR results
-            enhanced_image = self._enhance_image_for_ocr(pil_image)
+            try:
+                enhanced_image = self._enhance_gray_for_ocr(gray)
+            except Exception:
+                enhanced_image = gray
 
             # Configure Tesseract for better results
             custom_config = r'--oem 3 --psm 6 -c tessedit_char_whitelist=ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789.,!?;:()[]{}"\'-+=/\\@#$%^&*<>|~`_ '
@@ -441,8 +435,8 @@ class PresentationTracker:
     def _enhance_image_for_ocr(self, pil_image: Image.Image) -> Image.Image:
         """Enhance image quality for better OCR results"""
         try:
-            # Convert to numpy array for OpenCV processing
-            img_array = np.array(pil_image)
+            # View as numpy array for OpenCV processing
+            img_array = np.asarray(pil_image)
 
             # Convert to grayscale if needed
             if len(img_array.shape) == 3:
@@ -450,23 +444,22 @@ class PresentationTracker:
             else:
                 gray = img_array
 
-            # Apply image enhancement techniques
-            # 1. Increase contrast
-            enhanced = cv2.convertScaleAbs(gray, alpha=1.2, beta=10)
-
-            # 2. Apply Gaussian blur to reduce noise
-            blurred = cv2.GaussianBlur(enhanced, (1, 1), 0)
-
-            # 3. Apply threshold to get better text contrast
-            _, thresh = cv2.threshold(blurred, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
-
             # Convert back to PIL Image
-            return Image.fromarray(thresh)
+            return Image.fromarray(self._enhance_gray_for_ocr(gray))
 
         except Exception:
             # If enhancement fails, return original image
             return pil_image
 
+    def _enhance_gray_for_ocr(self, gray: np.ndarray) -> np.ndarray:
+        """Increase contrast and binarize a grayscale image for OCR"""
+        enhanced = cv2.convertScaleAbs(gray, alpha=1.2, beta=10)
+
+        # Otsu threshold for better text contrast; a (1, 1) Gaussian blur
+        # would be the identity, so none is applied
+        _, thresh = cv2.threshold(enhanced, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+        return thresh
+
     def detect_objects_in_slide(self, slide_index: Optional[int] = None) -> List[dict]:
         slide_image = self.get_slide_image(slide_index)
         if slide_image is None:
@@ -704,15 +697,18 @@ class PresentationTracker:
             return ""
 
         try:
-            # Convert to PIL image with proper color handling
+            # Straight from BGR to grayscale; tesseract takes numpy arrays,
+            # so no PIL conversion is needed
             if len(slide_image.shape) == 3 and slide_image.shape[2] == 3:
-                # BGR to RGB conversion for OpenCV images
-                pil_image = Image.fromarray(cv2.cvtColor(slide_image, cv2.COLOR_BGR2RGB))
+                gray = cv2.cvtColor(slide_image, cv2.COLOR_BGR2GRAY)
             else:
-                pil_image = Image.fromarray(slide_image)
+                gray = slide_image
 
             # Enhance image for better OCR results
-            enhanced_image = self._enhance_image_for_ocr(pil_image)
+            try:
+                enhanced_image = self._enhance_gray_for_ocr(gray)
+            except Exception:
+                enhanced_image = gray
 
             # Configure Tesseract for better results
             custom_config = r'--oem 3 --psm 6 -c tessedit_char_whitelist=ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789.,!?;:()[]{}"\'-+=/\\@#$%^&*<>|~`_ '
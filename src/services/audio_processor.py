@@ -60,6 +60,7 @@ class AudioProcessor:
 
         # Transcription
         self.whisper_model = None
+        self.whisper_device = "cpu"
         self.transcription_callback: Optional[Callable[[TranscriptionResult], None]] = None
 
         # Threading
@@ -98,8 +99,11 @@ class AudioProcessor:
             return
 
         try:
-            self.logger.info("Loading Whisper model...")
-            self.whisper_model = whisper.load_model("base")
+            import torch
+            self.whisper_device = "cuda" if torch.cuda.is_available() else "cpu"
+
+            self.logger.info(f"Loading Whisper model on {self.whisper_device}...")
+            self.whisper_model = whisper.load_model("base", device=self.whisper_device)
             self.logger.info("Whisper model loaded successfully")
         except Exception as e:
             self.logger.error(f"Failed to load Whisper model: {e}")
@@ -249,7 +253,9 @@ class AudioProcessor:
             audio_float = combined_audio.astype(np.float32) / 32768.0
 
             # Transcribe with Whisper
-            result = self.whisper_model.transcribe(audio_float)
+            result = self.whisper_model.transcribe(
+                audio_float, fp16=(self.whisper_device == "cuda")
+            )
 
             if result and result.get("text", "").strip():
                 transcription_result = TranscriptionResult(
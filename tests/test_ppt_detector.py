@@ -0,0 +1,99 @@
+"""Slide-text cache of the .ppt detector, with AppleScript stubbed out."""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add the src directory to the Python path, as main.py does
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from core.presentation.ppt_detector import PPTDetector
+
+
+class _StubRunner:
+    """Stands in for _OSAKitRunner; answers each handler from canned results"""
+
+    def __init__(self, detect_output=''):
+        self.detect_output = detect_output
+        self.calls = []
+
+    def run(self, source, timeout, handler=None, args=()):
+        self.calls.append((handler, args))
+        if handler == 'detectslide':
+            return self.detect_output, ''
+        if handler == 'slidetext':
+            return f"text of slide {args[0]}", ''
+        if handler == 'slidetexts':
+            return '\x1e'.join(f"{n}\x1ftext of slide {n}" for n in args[0].split(',')), ''
+        return None, 'unexpected script'
+
+
+@pytest.fixture
+def detector():
+    detector = PPTDetector()
+    detector._osa = _StubRunner()
+    detector._cache_presentation = 'deck.ppt'
+    detector.text_cache_size = 2
+    return detector
+
+
+def _cached_slides(detector):
+    return [slide for _, slide in detector._text_cache]
+
+
+def test_hit_refreshes_recency(detector):
+    detector._cache_text(1, 'one')
+    detector._cache_text(2, 'two')
+    assert detector._get_slide_text(1) == 'one'  # Hit: slide 2 is now least recently used
+    detector._cache_text(3, 'three')
+
+    assert _cached_slides(detector) == [1, 3]
+    assert detector._osa.calls == []
+
+
+def test_miss_fetches_and_caches(detector):
+    assert detector._get_slide_text(4) == 'text of slide 4'
+    assert detector._get_slide_text(4) == 'text of slide 4'
+    assert detector._osa.calls == [('slidetext', (4,))]
+
+
+def test_refresh_rereads_cached_slide(detector):
+    detector._cache_text(1, 'stale')
+    assert detector._get_slide_text(1, refresh=True) == 'text of slide 1'
+    assert detector._get_slide_text(1) == 'text of slide 1'
+
+
+def test_error_text_is_not_cached(detector):
+    detector._cache_text(1, '[AppleScript error: not running]')
+    assert _cached_slides(detector) == []
+
+
+def test_presentation_change_clears_cache(detector):
+    detector._cache_text(1, 'one')
+    detector._osa.detect_output = 'other.ppt|10|1|0|selection|2||second slide'
+
+    info = detector.detect_current_slide_simple()
+
+    assert info['current_slide'] == 2
+    assert info['slide_text'] == 'second slide'
+    assert list(detector._text_cache) == [('other.ppt', 2)]
+    # The old deck's slides are not offered to the script as already known
+    assert detector._osa.calls[0] == ('detectslide', ('deck.ppt', '1'))
+
+
+def test_concurrent_batch_requests_share_one_call(detector):
+    detector.text_cache_size = 8
+    detector._cache_text(1, 'one')
+
+    async def fetch():
+        return await asyncio.gather(detector.aget_slide_texts([1, 2]),
+                                    detector.aget_slide_texts([2, 3]))
+
+    first, second = asyncio.run(fetch())
+
+    assert first == {1: 'one', 2: 'text of slide 2'}
+    assert second == {2: 'text of slide 2', 3: 'text of slide 3'}
+    assert detector._osa.calls == [('slidetexts', ('2,3',))]
+    assert detector._pending_texts == {}
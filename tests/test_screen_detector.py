@@ -0,0 +1,74 @@
+"""OCR result handling of the screen detector, on synthetic image_to_data output."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add the src directory to the Python path, as main.py does
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+try:
+    from core.presentation.screen_detector import PowerPointScreenDetector
+except Exception as e:  # pyautogui also fails without a display
+    pytest.skip(f"screen detector dependencies not available: {e}", allow_module_level=True)
+
+
+# (level, block, par, line, word, top, conf, text) as pytesseract's image_to_data
+# reports them: structural rows carry conf -1 and no text
+_ROWS = [
+    (1, 0, 0, 0, 0, 0, -1, ''),
+    (2, 1, 0, 0, 0, 10, -1, ''),
+    (3, 1, 1, 0, 0, 10, -1, ''),
+    (4, 1, 1, 1, 0, 10, -1, ''),
+    (5, 1, 1, 1, 1, 10, 95, 'Quarterly'),
+    (5, 1, 1, 1, 2, 10, 93, 'Review'),
+    (4, 1, 1, 2, 0, 60, -1, ''),
+    (5, 1, 1, 2, 1, 60, 88, 'Revenue'),
+    (5, 1, 1, 2, 2, 60, 12, '~'),  # Below the confidence threshold
+    (5, 1, 1, 2, 3, 60, 90, 'up'),
+    (2, 2, 0, 0, 0, 700, -1, ''),
+    (3, 2, 1, 0, 0, 700, -1, ''),
+    (4, 2, 1, 1, 0, 700, -1, ''),
+    (5, 2, 1, 1, 1, 700, 91, '12'),
+]
+
+
+def _image_to_data(rows):
+    keys = ('level', 'block_num', 'par_num', 'line_num', 'word_num', 'top', 'conf', 'text')
+    data = {key: [row[i] for row in rows] for i, key in enumerate(keys)}
+    data['left'] = [20 * row[4] for row in rows]
+    data['width'] = [15] * len(rows)
+    data['height'] = [12] * len(rows)
+    return data
+
+
+@pytest.fixture(scope="module")
+def detector():
+    return PowerPointScreenDetector()
+
+
+def test_extract_lines_groups_word_rows(detector):
+    assert detector._extract_lines(_image_to_data(_ROWS)) == ["Quarterly Review", "Revenue up", "12"]
+
+
+def test_extract_lines_without_words(detector):
+    assert detector._extract_lines(_image_to_data(_ROWS[:4])) == []
+    assert detector._extract_lines(_image_to_data([])) == []
+
+
+@pytest.mark.parametrize("text, number", [
+    ("Slide 4 of 9", 4),
+    # "Slide N" takes precedence over an earlier "N of M"
+    ("Page 3 of 9\nSlide 7", 7),
+    ("Agenda\n5 / 20", 5),
+    ("Agenda\n8", 8),
+])
+def test_detect_slide_number_from_text(detector, text, number):
+    assert detector.detect_slide_number({'text': text, 'words': []}) == number
+
+
+def test_detect_slide_number_from_bottom_words(detector):
+    words, _ = detector._extract_words_with_positions(_image_to_data(_ROWS))
+    content = {'text': "Quarterly Review Revenue up 12th", 'words': words}
+    assert detector.detect_slide_number(content) == 12
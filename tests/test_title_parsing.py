@@ -0,0 +1,30 @@
+"""Slide number parsing from PowerPoint window titles."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add the src directory to the Python path, as main.py does
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from core.presentation.detector import PowerPointWindowDetector
+
+
+@pytest.fixture(scope="module")
+def detector():
+    return PowerPointWindowDetector()
+
+
+@pytest.mark.parametrize("title, current, total", [
+    # Two candidates: "Slide N of M" takes precedence over an earlier "N/M"
+    ("Deck 2/3 - Slide 5 of 10", 5, 10),
+    # Two candidates: "N/M" takes precedence over an earlier "N of M"
+    ("Part 1 of 4 - 7/20", 7, 20),
+    ("Slide 3", 3, None),
+    ("Quarterly Review - PowerPoint", None, None),
+])
+def test_title_pattern_precedence(detector, title, current, total):
+    info = detector.extract_slide_info_from_title(title)
+    assert info['current_slide'] == current
+    assert info['total_slides'] == total
@@ -0,0 +1,56 @@
+"""Embedding cache of the vector store."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add the src directory to the Python path, as main.py does
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+pytest.importorskip("numpy")
+
+from core.ai.vector_store import VectorStore
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    store = VectorStore(str(tmp_path))
+    store._embedding_cache_size = 2
+    computed = []
+
+    def compute(text):
+        computed.append(text)
+        return [float(len(text))]
+
+    monkeypatch.setattr(store, '_compute_embedding', compute)
+    store.computed = computed
+    return store
+
+
+def test_identical_text_is_embedded_once(store):
+    assert store._generate_embedding("alpha") == store._generate_embedding("alpha")
+    assert store.computed == ["alpha"]
+
+
+def test_hit_protects_entry_from_eviction(store):
+    store._generate_embedding("alpha")
+    store._generate_embedding("beta")
+    store._generate_embedding("alpha")  # Hit: "beta" is now least recently used
+    store._generate_embedding("gamma")
+
+    store._generate_embedding("alpha")
+    assert store.computed == ["alpha", "beta", "gamma"]
+    store._generate_embedding("beta")
+    assert store.computed == ["alpha", "beta", "gamma", "beta"]
+
+
+def test_restoring_a_cached_key_does_not_evict(store):
+    store._cache_embedding(store._text_key("alpha"), [1.0])
+    store._cache_embedding(store._text_key("beta"), [2.0])
+    store._cache_embedding(store._text_key("alpha"), [3.0])
+
+    assert len(store._embedding_cache) == 2
+    assert store._generate_embedding("alpha") == [3.0]
+    assert store._generate_embedding("beta") == [2.0]
+    assert store.computed == []